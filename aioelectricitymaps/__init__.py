@@ -1,25 +1,112 @@
 """ElectricityMaps wrapper."""
 
-from .electricitymaps import ElectricityMaps
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
+    ElectricityMapsCircuitOpenError,
     ElectricityMapsConnectionError,
     ElectricityMapsConnectionTimeoutError,
     ElectricityMapsError,
     ElectricityMapsInvalidTokenError,
     ElectricityMapsNoDataError,
+    ElectricityMapsRateLimitError,
 )
-from .models import HomeAssistantCarbonIntensityResponse, Zone
-from .request import CoordinatesRequest, ZoneRequest
+
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker
+    from .cache import ResponseCache
+    from .electricitymaps import ElectricityMaps
+    from .hedge import HedgePolicy
+    from .history import CarbonIntensityHistoryStore, PowerBreakdownHistoryStore
+    from .metrics import InMemoryMetrics, MetricsCollector
+    from .models import HomeAssistantCarbonIntensityResponse, Zone
+    from .persistent import PersistentCache, SQLiteCacheBackend
+    from .poller import CarbonIntensityPoller
+    from .pool import ConnectionPoolConfig
+    from .ratelimit import RateLimiter
+    from .request import CoordinatesRequest, ZoneRequest
+    from .resolver import CoordinateZoneResolver
+    from .retry import RetryPolicy
+    from .scheduler import GreenestWindow
+    from .sync import SyncElectricityMaps
+    from .tokens import TokenPool
+    from .zone_index import ZoneIndex
+
+# Imported on first access, so importing the package doesn't pull in aiohttp.
+_LAZY_IMPORTS = {
+    "CarbonIntensityHistoryStore": ".history",
+    "CarbonIntensityPoller": ".poller",
+    "CircuitBreaker": ".breaker",
+    "ConnectionPoolConfig": ".pool",
+    "CoordinateZoneResolver": ".resolver",
+    "CoordinatesRequest": ".request",
+    "ElectricityMaps": ".electricitymaps",
+    "GreenestWindow": ".scheduler",
+    "HedgePolicy": ".hedge",
+    "HomeAssistantCarbonIntensityResponse": ".models",
+    "InMemoryMetrics": ".metrics",
+    "MetricsCollector": ".metrics",
+    "PersistentCache": ".persistent",
+    "PowerBreakdownHistoryStore": ".history",
+    "RateLimiter": ".ratelimit",
+    "ResponseCache": ".cache",
+    "RetryPolicy": ".retry",
+    "SQLiteCacheBackend": ".persistent",
+    "SyncElectricityMaps": ".sync",
+    "TokenPool": ".tokens",
+    "Zone": ".models",
+    "ZoneIndex": ".zone_index",
+    "ZoneRequest": ".request",
+}
 
 __all__ = [
+    "CarbonIntensityHistoryStore",
+    "CarbonIntensityPoller",
+    "CircuitBreaker",
+    "ConnectionPoolConfig",
+    "CoordinateZoneResolver",
     "CoordinatesRequest",
     "ElectricityMaps",
+    "ElectricityMapsCircuitOpenError",
     "ElectricityMapsConnectionError",
     "ElectricityMapsConnectionTimeoutError",
     "ElectricityMapsError",
     "ElectricityMapsInvalidTokenError",
     "ElectricityMapsNoDataError",
+    "ElectricityMapsRateLimitError",
+    "GreenestWindow",
+    "HedgePolicy",
     "HomeAssistantCarbonIntensityResponse",
+    "InMemoryMetrics",
+    "MetricsCollector",
+    "PersistentCache",
+    "PowerBreakdownHistoryStore",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCacheBackend",
+    "SyncElectricityMaps",
+    "TokenPool",
     "Zone",
+    "ZoneIndex",
     "ZoneRequest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names of the package."""
+    return sorted(__all__)
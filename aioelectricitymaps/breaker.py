@@ -0,0 +1,162 @@
+"""Circuit breaker for the Electricity Maps client."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+from aiohttp import ClientResponseError
+
+from .exceptions import (
+    ElectricityMapsCircuitOpenError,
+    ElectricityMapsConnectionError,
+    ElectricityMapsConnectionTimeoutError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+    from .request import BaseRequest
+
+
+def _is_failure(exception: BaseException) -> bool:
+    """Check if an error says the API is unhealthy.
+
+    Timeouts, errors without a response, 5xx and 429 responses count. Other
+    responses, like a 404 for an unknown zone, show the API is answering.
+    """
+    if isinstance(exception, ElectricityMapsConnectionTimeoutError):
+        return True
+
+    if not isinstance(exception, ElectricityMapsConnectionError) or isinstance(
+        exception,
+        ElectricityMapsCircuitOpenError,
+    ):
+        return False
+
+    cause = exception.__cause__
+    if isinstance(cause, ClientResponseError):
+        return cause.status >= 500 or cause.status == 429
+
+    return True
+
+
+@dataclass(slots=True)
+class _Circuit:
+    """State of one circuit."""
+
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+
+@dataclass(kw_only=True)
+class CircuitBreaker:
+    """Fail fast on endpoints that keep failing.
+
+    A circuit opens after failure_threshold consecutive timeouts, connection
+    errors, 5xx or 429 responses. While open, requests fail right away with
+    ElectricityMapsCircuitOpenError, which carries the last good result of
+    the request. After reset_timeout seconds a single probe request is let
+    through; it closes the circuit on success and reopens it on failure.
+
+    Circuits are kept per endpoint, or per endpoint and zone with per_zone.
+    Only circuits with recent failures are tracked; they and the last good
+    results are each limited to max_size entries, least recently used first.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    per_zone: bool = False
+    max_size: int = 1024
+
+    _circuits: OrderedDict[str, _Circuit] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    _last_good: OrderedDict[Hashable, tuple[Any, float]] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+
+    def circuit_for(self, url: str, request: BaseRequest | None = None) -> str:
+        """Return the name of the circuit a request goes through."""
+        if self.per_zone and request is not None:
+            return f"{url}?{urlencode(request.key)}"
+        return url
+
+    def is_open(self, circuit: str) -> bool:
+        """Check if a circuit currently rejects requests."""
+        state = self._circuits.get(circuit)
+        return state is not None and state.opened_at is not None
+
+    def remember(self, key: Hashable, result: Any) -> None:
+        """Keep the last good result of a request."""
+        self._last_good[key] = (result, time.monotonic())
+        self._last_good.move_to_end(key)
+        while len(self._last_good) > self.max_size:
+            self._last_good.popitem(last=False)
+
+    def _check(self, circuit: str, key: Hashable) -> None:
+        """Raise if the circuit is open, or let this request probe it."""
+        state = self._circuits.get(circuit)
+        if state is None or state.opened_at is None:
+            return
+
+        retry_after = state.opened_at + self.reset_timeout - time.monotonic()
+        if retry_after <= 0 and not state.probing:
+            state.probing = True
+            return
+
+        last_known_good, stale_for = None, None
+        if (entry := self._last_good.get(key)) is not None:
+            last_known_good = entry[0]
+            stale_for = time.monotonic() - entry[1]
+
+        msg = "Circuit is open after repeated errors of the Electricity Maps API"
+        raise ElectricityMapsCircuitOpenError(
+            msg,
+            retry_after=max(retry_after, 0.0),
+            last_known_good=last_known_good,
+            stale_for=stale_for,
+        )
+
+    @contextmanager
+    def guard(self, circuit: str, key: Hashable) -> Iterator[None]:
+        """Run a request through a circuit and record its outcome."""
+        self._check(circuit, key)
+        state = self._circuits.setdefault(circuit, _Circuit())
+        self._circuits.move_to_end(circuit)
+        while len(self._circuits) > self.max_size:
+            self._circuits.popitem(last=False)
+
+        try:
+            yield
+        except BaseException as exception:
+            if _is_failure(exception):
+                state.failures += 1
+                if state.probing or state.failures >= self.failure_threshold:
+                    state.opened_at = time.monotonic()
+            # Other errors, e.g. an invalid token or an unknown zone, say
+            # nothing about the health of the API, but a cancelled probe must
+            # allow another.
+            state.probing = False
+            if not state.failures:
+                self._forget(circuit, state)
+            raise
+        else:
+            state.failures = 0
+            state.opened_at = None
+            state.probing = False
+            self._forget(circuit, state)
+
+    def _forget(self, circuit: str, state: _Circuit) -> None:
+        """Stop tracking a closed circuit without failures."""
+        if self._circuits.get(circuit) is state:
+            del self._circuits[circuit]
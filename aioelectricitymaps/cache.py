@@ -0,0 +1,83 @@
+"""In-memory response cache for the Electricity Maps client."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from .const import ApiEndpoints
+from .request import RequestKey
+
+# Endpoint URL, sorted query parameters and the name of the decoded model.
+CacheKey = tuple[str, RequestKey, str]
+
+
+def _default_ttls() -> dict[str, float]:
+    """Return the default per-endpoint TTLs in seconds."""
+    return {ApiEndpoints.ZONES: 86400.0}
+
+
+@dataclass(kw_only=True)
+class ResponseCache:
+    """LRU cache with per-endpoint TTLs for decoded API responses."""
+
+    max_size: int = 1024
+    default_ttl: float = 300.0
+    ttls: dict[str, float] = field(default_factory=_default_ttls)
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    _entries: OrderedDict[CacheKey, tuple[float, Any]] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL in seconds for the given endpoint."""
+        return self.ttls.get(url, self.default_ttl)
+
+    def get(self, key: CacheKey, *, count_miss: bool = True) -> Any | None:
+        """Return the cached value for key or None if missing or expired.
+
+        Lookups that fall back to other cached entries on a miss pass
+        count_miss=False, so one call isn't counted as several misses.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += int(count_miss)
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += int(count_miss)
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store value for key, evicting the least recently used entries."""
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -12,8 +12,11 @@ class ApiEndpoints:
     ZONES = API_BASE_URL + "/zones"
     LATEST_CARBON_INTENSITY = API_BASE_URL + "/carbon-intensity/latest"
     HISTORY_CARBON_INTENSITY = API_BASE_URL + "/carbon-intensity/history"
+    PAST_RANGE_CARBON_INTENSITY = API_BASE_URL + "/carbon-intensity/past-range"
+    FORECAST_CARBON_INTENSITY = API_BASE_URL + "/carbon-intensity/forecast"
     LATEST_POWER_BREAKDOWN = API_BASE_URL + "/power-breakdown/latest"
     HISTORY_POWER_BREAKDOWN = API_BASE_URL + "/power-breakdown/history"
+    PAST_RANGE_POWER_BREAKDOWN = API_BASE_URL + "/power-breakdown/past-range"
 
 
 class Status(StrEnum):
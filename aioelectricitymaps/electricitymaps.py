@@ -2,72 +2,646 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import hashlib
 import logging
 import socket
-from typing import TYPE_CHECKING, Self
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, Self, TypeVar, cast
+from urllib.parse import urlencode
 
 from aiohttp import ClientError, ClientResponseError, ClientSession
+import orjson
 
 from .const import ApiEndpoints
 from .exceptions import (
     ElectricityMapsConnectionError,
     ElectricityMapsConnectionTimeoutError,
+    ElectricityMapsError,
     ElectricityMapsInvalidTokenError,
+    ElectricityMapsRateLimitError,
 )
 from .models import (
+    CarbonIntensity,
+    CarbonIntensityColumns,
+    CarbonIntensityForecast,
+    CarbonIntensityForecastColumns,
     CarbonIntensityHistory,
+    CarbonIntensityPastRange,
     HomeAssistantCarbonIntensityResponse,
     LatestCarbonIntensity,
     LatestPowerBreakdown,
+    PowerBreakdown,
+    PowerBreakdownColumns,
     PowerBreakdownHistory,
+    PowerBreakdownPastRange,
     Zone,
+    ZoneSnapshot,
     ZonesResponse,
 )
+from .pool import ConnectionPoolConfig
+from .request import PastRangeRequest
+from .retry import RetryPolicy, parse_retry_after
+from .scheduler import GreenestWindow, greenest_window_index, to_epoch, window_size
+from .zone_index import ZoneIndex
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+    from .breaker import CircuitBreaker
+    from .cache import CacheKey, ResponseCache
+    from .hedge import HedgePolicy
+    from .metrics import MetricsCollector
+    from .persistent import PersistentCache
+    from .ratelimit import RateLimiter
     from .request import BaseRequest, CoordinatesRequest, ZoneRequest
+    from .resolver import CoordinateZoneResolver
+    from .tokens import TokenPool
 
 _LOGGER = logging.getLogger(__name__)
 
+_DAY = timedelta(days=1)
+
+
+class _Decodable(Protocol):
+    """Model that can be decoded from a response body."""
+
+    @classmethod
+    def from_json(cls, data: bytes) -> Self:
+        """Decode the model from a response body."""
+
+
+class _Response(NamedTuple):
+    """Status, body and cache validators of a response."""
+
+    status: int
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class _Validated:
+    """Last decoded response of a request and the validators to revalidate it."""
+
+    result: Any
+    digest: bytes
+    etag: str | None
+    last_modified: str | None
+
+    def headers(self) -> dict[str, str]:
+        """Return the headers revalidating the response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(slots=True, frozen=True)
+class _HistoryRows:
+    """History response parsed into plain rows, decoded to models on demand."""
+
+    zone: str | None
+    history: list[dict[str, Any]]
+
+    @classmethod
+    def from_json(cls, data: bytes) -> Self:
+        """Parse a history response body."""
+        payload = orjson.loads(data)
+        return cls(zone=payload.get("zone"), history=payload["history"])
+
+
+@asynccontextmanager
+async def _deadline(timeout: float | None) -> AsyncIterator[None]:
+    """Raise a timeout error if the block takes longer than timeout seconds."""
+    try:
+        async with asyncio.timeout(timeout):
+            yield
+    except TimeoutError as exception:
+        msg = "Timeout occurred while waiting for the Electricity Maps API"
+        raise ElectricityMapsConnectionTimeoutError(msg) from exception
+
+
+_ModelT = TypeVar("_ModelT", bound=_Decodable)
+_RequestT = TypeVar("_RequestT", bound="BaseRequest")
+_ResultT = TypeVar("_ResultT")
+
 
 @dataclass(kw_only=True)
 class ElectricityMaps:
     """ElectricityMaps API client."""
 
-    token: str
+    token: str | None = None
+    token_pool: TokenPool | None = None
     session: ClientSession | None = None
+    cache: ResponseCache | None = None
+    max_concurrency: int = 10
+    rate_limiter: RateLimiter | None = None
+    retry: RetryPolicy | None = None
+    pool: ConnectionPoolConfig = field(default_factory=ConnectionPoolConfig)
+    persistent_cache: PersistentCache | None = None
+    conditional_requests: bool = False
+    conditional_cache_size: int = 1024
+    metrics: MetricsCollector | None = None
+    zone_index: ZoneIndex | None = None
+    zone_resolver: CoordinateZoneResolver | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    hedge: HedgePolicy | None = None
 
     _close_session: bool = False
+    _in_flight: dict[CacheKey, asyncio.Future[Any]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _waiters: Counter[CacheKey] = field(default_factory=Counter, init=False, repr=False)
+    _validated: OrderedDict[CacheKey, _Validated] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    _refreshing: set[str] = field(default_factory=set, init=False, repr=False)
+    _background_tasks: set[asyncio.Task[None]] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+    )
+
+    def _ensure_session(self) -> ClientSession:
+        """Return the session, creating one from the pool config if needed."""
+        if self.session is None:
+            self.session = self.pool.create_session()
+            self._close_session = True
+
+        return self.session
 
     async def _get(
         self,
         *,
         url: str,
+        model: type[_ModelT],
         request: BaseRequest | None = None,
         unauthenticated: bool = False,
-    ) -> str:
-        """Execute a GET request against the API."""
-        if self.session is None:
-            self.session = ClientSession()
-            self._close_session = True
+        timeout: float | None = None,
+        retain: bool = True,
+    ) -> _ModelT:
+        """Fetch and decode a response, serving it from the cache if possible.
+
+        If no response arrived within timeout seconds, a timeout error is
+        raised, and the request is cancelled unless others are waiting for it.
+        Without retain, the result is not kept by the cache, the conditional
+        requests or the circuit breaker once every caller received it.
+        """
+        if self.zone_resolver is not None and request is not None:
+            request = self.zone_resolver.resolve(request)
 
-        headers = {} if unauthenticated else {"auth-token": self.token}
+        key: CacheKey = (
+            url,
+            request.key if request else (),
+            model.__qualname__,
+        )
+        if (
+            retain
+            and self.cache is not None
+            and (cached := self.cache.get(key)) is not None
+        ):
+            if self.metrics is not None:
+                self.metrics.on_cache_hit(url)
+            return cached  # type: ignore[no-any-return]
+
+        # Identical concurrent calls share one request. The shared future is
+        # shielded so a cancelled waiter doesn't cancel it for everyone else.
+        if (in_flight := self._in_flight.get(key)) is None:
+            in_flight = asyncio.ensure_future(
+                self._fetch(
+                    key=key,
+                    url=url,
+                    model=model,
+                    request=request,
+                    unauthenticated=unauthenticated,
+                    retain=retain,
+                ),
+            )
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(
+                lambda future: self._finish_in_flight(key, future),
+            )
+
+        self._waiters[key] += 1
+        try:
+            if timeout is None:
+                return await asyncio.shield(in_flight)
+            async with _deadline(timeout):
+                return await asyncio.shield(in_flight)
+        except ElectricityMapsConnectionTimeoutError:
+            if self._waiters[key] == 1:
+                in_flight.cancel()
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def _finish_in_flight(self, key: CacheKey, future: asyncio.Future[Any]) -> None:
+        """Forget a finished in-flight request."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every waiter went away.
+            future.exception()
+
+    async def _fetch(
+        self,
+        *,
+        key: CacheKey,
+        url: str,
+        model: type[_ModelT],
+        request: BaseRequest | None = None,
+        unauthenticated: bool = False,
+        retain: bool = True,
+    ) -> _ModelT:
+        """Fetch, decode and cache a response.
+
+        With conditional_requests, responses are revalidated with the ETag and
+        Last-Modified validators of the previous response. If the server
+        answers 304, or returns the same body again, the previously decoded
+        result is reused without decoding, so callers share that object.
+        """
+        conditional = self.conditional_requests and retain
+        validated = self._validated.get(key) if conditional else None
+        headers = {} if validated is None else validated.headers()
+
+        with (
+            nullcontext()
+            if self.circuit_breaker is None
+            else self.circuit_breaker.guard(
+                self.circuit_breaker.circuit_for(url, request),
+                key,
+            )
+        ):
+            response = await self._get_body(
+                url=url,
+                request=request,
+                unauthenticated=unauthenticated,
+                headers=headers,
+            )
 
-        _LOGGER.debug("Doing request: GET %s %s", url, str(request))
+        if validated is not None and response.status == 304:
+            result: _ModelT = validated.result
+        else:
+            digest = hashlib.blake2b(response.body, digest_size=16).digest()
+            if validated is not None and validated.digest == digest:
+                result = validated.result
+            elif self.metrics is None:
+                result = model.from_json(response.body)
+            else:
+                start = time.perf_counter()
+                result = model.from_json(response.body)
+                self.metrics.on_decode(url, time.perf_counter() - start)
+
+            if conditional:
+                self._validated[key] = _Validated(
+                    result=result,
+                    digest=digest,
+                    etag=response.etag,
+                    last_modified=response.last_modified,
+                )
+                self._validated.move_to_end(key)
+                while len(self._validated) > self.conditional_cache_size:
+                    self._validated.popitem(last=False)
+
+        if retain and self.cache is not None:
+            self.cache.set(key, result)
+
+        if retain and self.circuit_breaker is not None:
+            self.circuit_breaker.remember(key, result)
+
+        if self.zone_resolver is not None and request is not None:
+            self.zone_resolver.learn(request, result)
+
+        return result
+
+    async def _get_body(
+        self,
+        *,
+        url: str,
+        request: BaseRequest | None = None,
+        unauthenticated: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> _Response:
+        """Return a response, serving it from the persistent cache if possible.
+
+        Stale entries are served right away while a background task refreshes
+        them.
+        """
+        if self.persistent_cache is None:
+            return await self._request(
+                url=url,
+                request=request,
+                unauthenticated=unauthenticated,
+                headers=headers,
+            )
+
+        key = url
+        if request:
+            key += "?" + urlencode(request.key)
+
+        if (entry := await self.persistent_cache.load(key)) is not None:
+            body, age = entry
+            if not self.persistent_cache.is_fresh(key, age) and (
+                key not in self._refreshing
+            ):
+                self._refreshing.add(key)
+                task = asyncio.create_task(
+                    self._refresh(
+                        self.persistent_cache,
+                        key=key,
+                        url=url,
+                        request=request,
+                        unauthenticated=unauthenticated,
+                    ),
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return _Response(status=200, body=body)
+
+        # Another process sharing the cache is fetching it, so wait for it.
+        claimed = await self.persistent_cache.claim(key)
+        if not claimed and (shared := await self.persistent_cache.wait_for(key)):
+            return _Response(status=200, body=shared)
+
+        try:
+            response = await self._request(
+                url=url,
+                request=request,
+                unauthenticated=unauthenticated,
+            )
+            await self.persistent_cache.store(key, response.body)
+        finally:
+            if claimed:
+                await self.persistent_cache.release(key)
+        return response
+
+    async def _refresh(
+        self,
+        persistent_cache: PersistentCache,
+        *,
+        key: str,
+        url: str,
+        request: BaseRequest | None = None,
+        unauthenticated: bool = False,
+    ) -> None:
+        """Refresh a stale entry of the persistent cache.
+
+        Nothing is fetched if another process sharing the cache refreshes it.
+        """
+        try:
+            if not await persistent_cache.claim(key):
+                return
+
+            try:
+                response = await self._request(
+                    url=url,
+                    request=request,
+                    unauthenticated=unauthenticated,
+                )
+                await persistent_cache.store(key, response.body)
+            finally:
+                await persistent_cache.release(key)
+        except ElectricityMapsError as exception:
+            _LOGGER.debug("Refreshing %s failed: %s", key, exception)
+        finally:
+            self._refreshing.discard(key)
+
+    async def _request(
+        self,
+        *,
+        url: str,
+        request: BaseRequest | None = None,
+        unauthenticated: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> _Response:
+        """Execute a GET request, retrying it according to the retry policy."""
+        attempt = 0
+        rotations = 0
+        while True:
+            try:
+                return await self._request_once(
+                    url=url,
+                    request=request,
+                    unauthenticated=unauthenticated,
+                    headers=headers,
+                )
+            except ElectricityMapsError as exception:
+                if self.metrics is not None:
+                    self.metrics.on_error(url, exception)
+
+                # A rejected or rate limited token has been reported to the
+                # pool, so try again with the next best token. If every token
+                # is benched, the retry policy decides instead of waiting for
+                # the benched token to resend the same request.
+                if (
+                    self.token_pool is not None
+                    and not unauthenticated
+                    and isinstance(
+                        exception,
+                        ElectricityMapsInvalidTokenError
+                        | ElectricityMapsRateLimitError,
+                    )
+                    and rotations < len(self.token_pool.tokens)
+                    and self.token_pool.available()
+                ):
+                    rotations += 1
+                    continue
+
+                if (
+                    self.retry is None
+                    or (delay := self.retry.retry_delay(exception, attempt)) is None
+                ):
+                    raise
+
+                if self.metrics is not None:
+                    self.metrics.on_retry(url)
+
+                _LOGGER.debug(
+                    "Retrying request to %s in %.2fs after: %s",
+                    url,
+                    delay,
+                    exception,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _request_once(
+        self,
+        *,
+        url: str,
+        request: BaseRequest | None = None,
+        unauthenticated: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> _Response:
+        """Execute a GET request with a token from the pool, if any."""
+        token = None if unauthenticated else await self._acquire_token()
 
         params = {}
         if request:
             params = request.get_request_parameters()
 
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        if self.hedge is not None:
+            return await self._send_hedged(
+                url=url,
+                params=params,
+                headers=headers or {},
+                token=token,
+            )
+
+        return await self._send_with_token(
+            url=url,
+            params=params,
+            headers=headers or {},
+            token=token,
+        )
+
+    async def _acquire_token(self) -> str:
+        """Return the token to authenticate the next request with."""
+        if self.token_pool is not None:
+            return await self.token_pool.acquire()
+
+        if self.token is None:
+            msg = "No token or token pool given"
+            raise ElectricityMapsInvalidTokenError(msg)
+
+        return self.token
+
+    def _has_spare_budget(self) -> bool:
+        """Check if another request can be sent without waiting."""
+        if self.rate_limiter is not None and self.rate_limiter.headroom() < 1:
+            return False
+        return self.token_pool is None or self.token_pool.headroom() >= 1
+
+    async def _send_with_token(
+        self,
+        *,
+        url: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        token: str | None,
+    ) -> _Response:
+        """Execute a GET request and report its outcome to the token pool."""
+        if token is None:
+            return await self._send(url=url, params=params, headers=headers)
+
+        headers = {**headers, "auth-token": token}
+        if self.token_pool is None:
+            return await self._send(url=url, params=params, headers=headers)
+
         try:
-            async with self.session.get(
+            response = await self._send(url=url, params=params, headers=headers)
+        except ElectricityMapsInvalidTokenError:
+            self.token_pool.report_invalid(token)
+            raise
+        except ElectricityMapsRateLimitError as exception:
+            self.token_pool.report_rate_limited(token, exception.retry_after)
+            raise
+
+        self.token_pool.report_success(token)
+        return response
+
+    async def _send_hedged(
+        self,
+        *,
+        url: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        token: str | None,
+    ) -> _Response:
+        """Execute a GET request, sending a duplicate if it is slower than usual.
+
+        The first successful response wins and the other request is cancelled.
+        A duplicate is only sent if the rate limiter and the token pool have
+        budget to spare, and it takes its own token from the pool.
+        """
+        hedge = cast("HedgePolicy", self.hedge)
+        start = time.perf_counter()
+        pending = {
+            asyncio.ensure_future(
+                self._send_with_token(
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    token=token,
+                ),
+            ),
+        }
+        error: BaseException | None = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge.delay(url))
+            if not done and self._has_spare_budget():
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                if self.token_pool is not None and token is not None:
+                    token = await self.token_pool.acquire()
+                _LOGGER.debug("Hedging slow request to %s", url)
+                pending.add(
+                    asyncio.ensure_future(
+                        self._send_with_token(
+                            url=url,
+                            params=params,
+                            headers=headers,
+                            token=token,
+                        ),
+                    ),
+                )
+
+            while True:
+                # Check every finished task, so no exception goes unretrieved.
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    hedge.observe(url, time.perf_counter() - start)
+                    return succeeded[0].result()
+                if error is None and done:
+                    error = next(iter(done)).exception()
+                if not pending and error is not None:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(
+        self,
+        *,
+        url: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+    ) -> _Response:
+        """Execute a GET request against the API."""
+        session = self._ensure_session()
+
+        _LOGGER.debug("Doing request: GET %s %s", url, params)
+
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        try:
+            async with session.get(
                 url,
                 headers=headers,
                 params=params,
             ) as response:
                 response.raise_for_status()
-                response_text = await response.text()
+                first_byte = time.perf_counter() if self.metrics is not None else 0.0
+                body = await response.read()
         except TimeoutError as exception:
             msg = "Timeout occurred while connecting to the Electricity Maps API"
             raise ElectricityMapsConnectionTimeoutError(msg) from exception
@@ -79,84 +653,457 @@ class ElectricityMaps:
                 msg = "The given token is invalid"
                 raise ElectricityMapsInvalidTokenError(msg) from exception
 
+            if isinstance(exception, ClientResponseError) and exception.status == 429:
+                msg = "Rate limit of the Electricity Maps API exceeded"
+                raise ElectricityMapsRateLimitError(
+                    msg,
+                    retry_after=parse_retry_after(
+                        exception.headers.get("Retry-After")
+                        if exception.headers
+                        else None,
+                    ),
+                ) from exception
+
             msg = "Error occurred while communicating to the Electricity Maps API"
             raise ElectricityMapsConnectionError(msg) from exception
 
-        _LOGGER.debug(
-            "Got response with status %s and body: %s",
-            response.status,
-            response_text,
-        )
+        if self.metrics is not None:
+            self.metrics.on_response(
+                url,
+                time_to_first_byte=first_byte - start,
+                body_read=time.perf_counter() - first_byte,
+                bytes_received=len(body),
+            )
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Got response with status %s and body: %s",
+                response.status,
+                body.decode(errors="replace"),
+            )
 
-        return response_text
+        return _Response(
+            status=response.status,
+            body=body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
 
     async def carbon_intensity_for_home_assistant(
         self,
         request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
     ) -> HomeAssistantCarbonIntensityResponse:
         """Get carbon intensity."""
-        result = await self._get(
+        return await self._get(
             url=ApiEndpoints.CARBON_INTENSITY_HA,
+            model=HomeAssistantCarbonIntensityResponse,
             request=request,
+            timeout=timeout,
         )
-        return HomeAssistantCarbonIntensityResponse.from_json(result)
 
     async def latest_carbon_intensity(
         self,
         request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
     ) -> LatestCarbonIntensity:
         """Get latest carbon intensity."""
-        result = await self._get(
+        return await self._get(
             url=ApiEndpoints.LATEST_CARBON_INTENSITY,
+            model=LatestCarbonIntensity,
             request=request,
+            timeout=timeout,
         )
-        return LatestCarbonIntensity.from_json(result)
 
     async def carbon_intensity_history(
         self,
         request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
     ) -> CarbonIntensityHistory:
         """Get carbon intensity history."""
-        result = await self._get(
+        return await self._get(
+            url=ApiEndpoints.HISTORY_CARBON_INTENSITY,
+            model=CarbonIntensityHistory,
+            request=request,
+            timeout=timeout,
+        )
+
+    async def iter_carbon_intensity_history(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> AsyncIterator[CarbonIntensity]:
+        """Get carbon intensity history, decoding one entry at a time.
+
+        The response is parsed whole before the first entry is yielded; only
+        the models are built lazily. It isn't cached, so nothing of it is kept
+        once iteration ends.
+        """
+        rows = await self._get(
             url=ApiEndpoints.HISTORY_CARBON_INTENSITY,
+            model=_HistoryRows,
             request=request,
+            timeout=timeout,
+            retain=False,
         )
-        return CarbonIntensityHistory.from_json(result)
+        for entry in rows.history:
+            yield CarbonIntensity.from_dict(entry)
+
+    async def carbon_intensity_history_columns(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityColumns:
+        """Get carbon intensity history decoded into arrays."""
+        return await self._get(
+            url=ApiEndpoints.HISTORY_CARBON_INTENSITY,
+            model=CarbonIntensityColumns,
+            request=request,
+            timeout=timeout,
+        )
+
+    async def carbon_intensity_past_range(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        start: datetime,
+        end: datetime,
+        timeout: float | None = None,
+    ) -> CarbonIntensityPastRange:
+        """Get carbon intensity between start and end."""
+        return await self._get(
+            url=ApiEndpoints.PAST_RANGE_CARBON_INTENSITY,
+            model=CarbonIntensityPastRange,
+            request=PastRangeRequest(request=request, start=start, end=end),
+            timeout=timeout,
+        )
+
+    async def carbon_intensity_forecast(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityForecast:
+        """Get carbon intensity forecast."""
+        return await self._get(
+            url=ApiEndpoints.FORECAST_CARBON_INTENSITY,
+            model=CarbonIntensityForecast,
+            request=request,
+            timeout=timeout,
+        )
+
+    async def carbon_intensity_forecast_columns(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityForecastColumns:
+        """Get carbon intensity forecast decoded into arrays."""
+        return await self._get(
+            url=ApiEndpoints.FORECAST_CARBON_INTENSITY,
+            model=CarbonIntensityForecastColumns,
+            request=request,
+            timeout=timeout,
+        )
+
+    async def greenest_window(
+        self,
+        requests: Iterable[CoordinatesRequest | ZoneRequest],
+        *,
+        duration: timedelta,
+        deadline: datetime,
+        earliest: datetime | None = None,
+        forecast: bool = True,
+        timeout: float | None = None,
+    ) -> GreenestWindow | None:
+        """Get the zone and start time with the lowest mean carbon intensity.
+
+        The series of all zones are fetched concurrently. Without forecast,
+        the history of the last day is used as the profile of the next one.
+        """
+        size = window_size(duration)
+        offset = 0 if forecast else int(_DAY.total_seconds())
+        earliest_epoch = to_epoch(earliest or datetime.now(UTC)) - offset
+        deadline_epoch = to_epoch(deadline) - offset
+
+        async def series(
+            request: CoordinatesRequest | ZoneRequest,
+        ) -> CarbonIntensityForecastColumns | CarbonIntensityColumns:
+            if forecast:
+                return await self.carbon_intensity_forecast_columns(
+                    request,
+                    timeout=timeout,
+                )
+            return await self.carbon_intensity_history_columns(
+                request,
+                timeout=timeout,
+            )
+
+        best: GreenestWindow | None = None
+        error: ElectricityMapsError | None = None
+        async for request, result in self._many(series, requests):
+            if isinstance(result, ElectricityMapsError):
+                _LOGGER.debug("Skipping %s: %s", request, result)
+                error = result
+                continue
+
+            found = greenest_window_index(
+                result.timestamps,
+                result.carbon_intensity,
+                size=size,
+                earliest=earliest_epoch,
+                latest=deadline_epoch,
+            )
+            if found is not None and (best is None or found[1] < best.carbon_intensity):
+                start = datetime.fromtimestamp(
+                    result.timestamps[found[0]] + offset,
+                    tz=UTC,
+                )
+                best = GreenestWindow(
+                    zone=result.zone,
+                    start=start,
+                    end=start + duration,
+                    carbon_intensity=found[1],
+                )
+
+        if best is None and error is not None:
+            raise error
+
+        return best
 
     async def latest_power_breakdown(
         self,
         request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
     ) -> LatestPowerBreakdown:
         """Get latest power breakdown."""
-        result = await self._get(
+        return await self._get(
             url=ApiEndpoints.LATEST_POWER_BREAKDOWN,
+            model=LatestPowerBreakdown,
             request=request,
+            timeout=timeout,
         )
-        return LatestPowerBreakdown.from_json(result)
 
     async def power_breakdown_history(
         self,
         request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
     ) -> PowerBreakdownHistory:
         """Get power breakdown history."""
-        result = await self._get(
+        return await self._get(
+            url=ApiEndpoints.HISTORY_POWER_BREAKDOWN,
+            model=PowerBreakdownHistory,
+            request=request,
+            timeout=timeout,
+        )
+
+    async def iter_power_breakdown_history(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> AsyncIterator[PowerBreakdown]:
+        """Get power breakdown history, decoding one entry at a time.
+
+        The response is parsed whole before the first entry is yielded; only
+        the models are built lazily. It isn't cached, so nothing of it is kept
+        once iteration ends.
+        """
+        rows = await self._get(
             url=ApiEndpoints.HISTORY_POWER_BREAKDOWN,
+            model=_HistoryRows,
             request=request,
+            timeout=timeout,
+            retain=False,
         )
-        return PowerBreakdownHistory.from_json(result)
+        for entry in rows.history:
+            yield PowerBreakdown.from_dict(entry)
 
-    async def zones(self) -> dict[str, Zone]:
+    async def power_breakdown_history_columns(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> PowerBreakdownColumns:
+        """Get power breakdown history decoded into arrays."""
+        return await self._get(
+            url=ApiEndpoints.HISTORY_POWER_BREAKDOWN,
+            model=PowerBreakdownColumns,
+            request=request,
+            timeout=timeout,
+        )
+
+    async def power_breakdown_past_range(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        start: datetime,
+        end: datetime,
+        timeout: float | None = None,
+    ) -> PowerBreakdownPastRange:
+        """Get power breakdown between start and end."""
+        return await self._get(
+            url=ApiEndpoints.PAST_RANGE_POWER_BREAKDOWN,
+            model=PowerBreakdownPastRange,
+            request=PastRangeRequest(request=request, start=start, end=end),
+            timeout=timeout,
+        )
+
+    async def zone_snapshot(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        home_assistant: bool = False,
+        timeout: float | None = None,
+    ) -> ZoneSnapshot:
+        """Get the latest carbon intensity and power breakdown of a zone at once.
+
+        The requests are sent concurrently and the snapshot is cached as one
+        entry next to its parts. Only the parts count towards cache misses.
+        """
+        key: CacheKey = (
+            ApiEndpoints.LATEST_CARBON_INTENSITY,
+            request.key,
+            ZoneSnapshot.__qualname__ + ("+home_assistant" if home_assistant else ""),
+        )
+        if (
+            self.cache is not None
+            and (cached := self.cache.get(key, count_miss=False)) is not None
+        ):
+            return cached  # type: ignore[no-any-return]
+
+        calls: list[Awaitable[Any]] = [
+            self.latest_carbon_intensity(request, timeout=timeout),
+            self.latest_power_breakdown(request, timeout=timeout),
+        ]
+        if home_assistant:
+            calls.append(
+                self.carbon_intensity_for_home_assistant(request, timeout=timeout),
+            )
+        carbon_intensity, power_breakdown, *rest = await asyncio.gather(*calls)
+        snapshot = ZoneSnapshot(
+            zone=carbon_intensity.zone,
+            carbon_intensity=carbon_intensity,
+            power_breakdown=power_breakdown,
+            home_assistant=rest[0] if rest else None,
+        )
+
+        if self.cache is not None:
+            self.cache.set(key, snapshot)
+
+        return snapshot
+
+    async def zones(self, *, timeout: float | None = None) -> dict[str, Zone]:
         """Get a dict of zones where carbon intensity is available."""
-        result = await self._get(url=ApiEndpoints.ZONES, unauthenticated=True)
-        return ZonesResponse.from_json(result).zones
+        result = await self._get(
+            url=ApiEndpoints.ZONES,
+            model=ZonesResponse,
+            unauthenticated=True,
+            timeout=timeout,
+        )
+        return dict(result.zones)
+
+    async def latest_carbon_intensity_many(
+        self,
+        requests: Iterable[CoordinatesRequest | ZoneRequest],
+        *,
+        timeout: float | None = None,
+    ) -> AsyncIterator[
+        tuple[
+            CoordinatesRequest | ZoneRequest,
+            LatestCarbonIntensity | ElectricityMapsError,
+        ]
+    ]:
+        """Get latest carbon intensity for many zones, yielding as they complete."""
+        async for item in self._many(
+            lambda request: self.latest_carbon_intensity(request, timeout=timeout),
+            requests,
+        ):
+            yield item
+
+    async def latest_power_breakdown_many(
+        self,
+        requests: Iterable[CoordinatesRequest | ZoneRequest],
+        *,
+        timeout: float | None = None,
+    ) -> AsyncIterator[
+        tuple[
+            CoordinatesRequest | ZoneRequest,
+            LatestPowerBreakdown | ElectricityMapsError,
+        ]
+    ]:
+        """Get latest power breakdown for many zones, yielding as they complete."""
+        async for item in self._many(
+            lambda request: self.latest_power_breakdown(request, timeout=timeout),
+            requests,
+        ):
+            yield item
+
+    async def _many(
+        self,
+        method: Callable[[_RequestT], Awaitable[_ResultT]],
+        requests: Iterable[_RequestT],
+    ) -> AsyncIterator[tuple[_RequestT, _ResultT | ElectricityMapsError]]:
+        """Run method for every request with at most max_concurrency in flight.
+
+        Errors are yielded next to their request instead of being raised, so
+        one failing zone doesn't abort the whole batch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(
+            request: _RequestT,
+        ) -> tuple[_RequestT, _ResultT | ElectricityMapsError]:
+            async with semaphore:
+                try:
+                    return request, await method(request)
+                except ElectricityMapsError as exception:
+                    return request, exception
+
+        tasks = [asyncio.ensure_future(run(request)) for request in requests]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def load_zone_index(self, *, timeout: float | None = None) -> ZoneIndex:
+        """Get an index of the zones, building it on first use.
+
+        The index is kept in zone_index and can be passed to other clients.
+        """
+        if self.zone_index is None:
+            result = await self._get(
+                url=ApiEndpoints.ZONES,
+                model=ZonesResponse,
+                unauthenticated=True,
+                timeout=timeout,
+            )
+            self.zone_index = ZoneIndex.from_response(result)
+
+        return self.zone_index
 
     async def close(self) -> None:
         """Close open client session."""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
         if self.session and self._close_session:
             await self.session.close()
 
     async def __aenter__(self) -> Self:
         """Async enter."""
+        if self.session is None:
+            await self.pool.prewarm(self._ensure_session())
         return self
 
     async def __aexit__(self, *_exc_info: object) -> None:
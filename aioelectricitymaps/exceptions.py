@@ -1,5 +1,7 @@
 """Exceptions for ElectricityMaps."""
 
+from typing import Any
+
 
 class ElectricityMapsError(Exception):
     """Generic error occurred in ElectricityMaps package."""
@@ -19,3 +21,33 @@ class ElectricityMapsConnectionTimeoutError(ElectricityMapsError):
 
 class ElectricityMapsInvalidTokenError(ElectricityMapsError):
     """Given token is invalid."""
+
+
+class ElectricityMapsRateLimitError(ElectricityMapsConnectionError):
+    """Rate limit of the Electricity Maps API has been exceeded."""
+
+    def __init__(self, msg: str, retry_after: float | None = None) -> None:
+        """Initialize with the delay requested by the API, if any."""
+        super().__init__(msg)
+        self.retry_after = retry_after
+
+
+class ElectricityMapsCircuitOpenError(ElectricityMapsConnectionError):
+    """Requests are failing fast after repeated errors of the API.
+
+    The last successfully decoded response of the request, if any, is kept in
+    last_known_good, with its age in seconds in stale_for.
+    """
+
+    def __init__(
+        self,
+        msg: str,
+        retry_after: float | None = None,
+        last_known_good: Any = None,
+        stale_for: float | None = None,
+    ) -> None:
+        """Initialize with the time until the next probe and the last result."""
+        super().__init__(msg)
+        self.retry_after = retry_after
+        self.last_known_good = last_known_good
+        self.stale_for = stale_for
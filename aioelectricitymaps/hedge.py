@@ -0,0 +1,45 @@
+"""Hedged requests for the Electricity Maps client."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import math
+
+
+@dataclass(kw_only=True)
+class HedgePolicy:
+    """When to send a duplicate of a request that is slower than usual.
+
+    The hedging delay of an endpoint is the given quantile of its last window
+    response times, so it follows the endpoint as it speeds up or slows down.
+    Until min_samples responses have been seen, initial_delay is used instead.
+    """
+
+    quantile: float = 0.95
+    initial_delay: float = 1.0
+    min_delay: float = 0.01
+    min_samples: int = 20
+    window: int = 200
+
+    _latency: dict[str, deque[float]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    def delay(self, url: str) -> float:
+        """Return how long to wait for a response before hedging."""
+        samples = self._latency.get(url)
+        if samples is None or len(samples) < self.min_samples:
+            return self.initial_delay
+
+        ordered = sorted(samples)
+        rank = max(math.ceil(self.quantile * len(ordered)), 1)
+        return max(ordered[rank - 1], self.min_delay)
+
+    def observe(self, url: str, seconds: float) -> None:
+        """Record the response time of an endpoint."""
+        if (samples := self._latency.get(url)) is None:
+            samples = self._latency[url] = deque(maxlen=self.window)
+        samples.append(seconds)
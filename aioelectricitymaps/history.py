@@ -0,0 +1,194 @@
+"""Incremental synchronization of the history of zones."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Generic, Protocol, TypeVar
+
+from .models import CarbonIntensity, PowerBreakdown
+
+if TYPE_CHECKING:
+    from .electricitymaps import ElectricityMaps
+    from .request import ZoneRequest
+
+_HOUR = timedelta(hours=1)
+
+
+class _HistoryEntry(Protocol):
+    """Entry of a history response."""
+
+    @property
+    def updated_at(self) -> datetime:
+        """Return when the entry was last updated."""
+
+    @property
+    def is_estimated(self) -> bool:
+        """Return whether the entry is an estimate."""
+
+
+_EntryT = TypeVar("_EntryT", bound=_HistoryEntry)
+
+
+def _changed(known: _HistoryEntry | None, entry: _HistoryEntry) -> bool:
+    """Check if an entry is new or replaces a known one."""
+    return (
+        known is None
+        or known.updated_at != entry.updated_at
+        or known.is_estimated != entry.is_estimated
+    )
+
+
+@dataclass(kw_only=True)
+class _HistoryStore(ABC, Generic[_EntryT]):
+    """Rolling window of history entries per zone, kept up to date incrementally.
+
+    The first sync of a zone fetches the full history. Later syncs only fetch
+    the hours from the first missing or estimated entry of the window onwards
+    using the past range endpoint, and return just the entries that changed.
+    """
+
+    client: ElectricityMaps
+    window: timedelta = timedelta(hours=24)
+    past_range: bool = True
+
+    _rows: dict[str, dict[datetime, _EntryT]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    @abstractmethod
+    def _timestamp(self, entry: _EntryT) -> datetime:
+        """Return the timestamp of an entry."""
+
+    @abstractmethod
+    async def _fetch_history(self, request: ZoneRequest) -> list[_EntryT]:
+        """Fetch the full history of a zone."""
+
+    @abstractmethod
+    async def _fetch_range(
+        self,
+        request: ZoneRequest,
+        start: datetime,
+        end: datetime,
+    ) -> list[_EntryT]:
+        """Fetch the entries of a zone between start and end."""
+
+    def history(self, zone: str) -> list[_EntryT]:
+        """Return the known entries of a zone, oldest first."""
+        return list(self._rows.get(zone, {}).values())
+
+    def merge(self, zone: str, entries: list[_EntryT]) -> list[_EntryT]:
+        """Merge entries into the window of a zone and return the changed ones.
+
+        An entry replaces a known one with the same timestamp if its updated_at
+        moved or its is_estimated flag flipped.
+        """
+        rows = self._rows.setdefault(zone, {})
+        changed = [
+            entry
+            for entry in entries
+            if _changed(rows.get(self._timestamp(entry)), entry)
+        ]
+        if not changed:
+            return []
+
+        for entry in changed:
+            rows[self._timestamp(entry)] = entry
+
+        cutoff = max(rows) - self.window
+        self._rows[zone] = {
+            timestamp: entry
+            for timestamp, entry in sorted(rows.items())
+            if timestamp > cutoff
+        }
+        return sorted(
+            (entry for entry in changed if self._timestamp(entry) > cutoff),
+            key=self._timestamp,
+        )
+
+    def first_outdated(self, zone: str, now: datetime) -> datetime | None:
+        """Return the first hour of the window that is missing or estimated."""
+        rows = self._rows.get(zone, {})
+        latest = now.replace(minute=0, second=0, microsecond=0)
+        hour = latest - self.window + _HOUR
+        while hour <= latest:
+            if (entry := rows.get(hour)) is None or entry.is_estimated:
+                return hour
+            hour += _HOUR
+        return None
+
+    async def sync(
+        self,
+        request: ZoneRequest,
+        *,
+        now: datetime | None = None,
+    ) -> list[_EntryT]:
+        """Bring the window of a zone up to date and return the changed entries."""
+        zone = request.zone
+        if now is None:
+            now = datetime.now(UTC)
+
+        if not self._rows.get(zone) or not self.past_range:
+            return self.merge(zone, await self._fetch_history(request))
+
+        if (start := self.first_outdated(zone, now)) is None:
+            return []
+
+        return self.merge(zone, await self._fetch_range(request, start, now))
+
+
+@dataclass(kw_only=True)
+class CarbonIntensityHistoryStore(_HistoryStore[CarbonIntensity]):
+    """Rolling carbon intensity history per zone."""
+
+    def _timestamp(self, entry: CarbonIntensity) -> datetime:
+        """Return the timestamp of an entry."""
+        return entry.timestamp
+
+    async def _fetch_history(self, request: ZoneRequest) -> list[CarbonIntensity]:
+        """Fetch the full history of a zone."""
+        return (await self.client.carbon_intensity_history(request)).history
+
+    async def _fetch_range(
+        self,
+        request: ZoneRequest,
+        start: datetime,
+        end: datetime,
+    ) -> list[CarbonIntensity]:
+        """Fetch the entries of a zone between start and end."""
+        result = await self.client.carbon_intensity_past_range(
+            request,
+            start=start,
+            end=end,
+        )
+        return result.data
+
+
+@dataclass(kw_only=True)
+class PowerBreakdownHistoryStore(_HistoryStore[PowerBreakdown]):
+    """Rolling power breakdown history per zone."""
+
+    def _timestamp(self, entry: PowerBreakdown) -> datetime:
+        """Return the timestamp of an entry."""
+        return entry.time
+
+    async def _fetch_history(self, request: ZoneRequest) -> list[PowerBreakdown]:
+        """Fetch the full history of a zone."""
+        return (await self.client.power_breakdown_history(request)).history
+
+    async def _fetch_range(
+        self,
+        request: ZoneRequest,
+        start: datetime,
+        end: datetime,
+    ) -> list[PowerBreakdown]:
+        """Fetch the entries of a zone between start and end."""
+        result = await self.client.power_breakdown_past_range(
+            request,
+            start=start,
+            end=end,
+        )
+        return result.data
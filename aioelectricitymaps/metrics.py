@@ -0,0 +1,136 @@
+"""Instrumentation hooks for the Electricity Maps client."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Protocol
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MetricsCollector(Protocol):
+    """Receives measurements from the client.
+
+    All methods are called with the endpoint URL the request was sent to.
+    """
+
+    def on_response(
+        self,
+        endpoint: str,
+        *,
+        time_to_first_byte: float,
+        body_read: float,
+        bytes_received: int,
+    ) -> None:
+        """Record the network timings of a response."""
+
+    def on_decode(self, endpoint: str, seconds: float) -> None:
+        """Record the time spent decoding a response."""
+
+    def on_cache_hit(self, endpoint: str) -> None:
+        """Record a response served from the in-memory cache."""
+
+    def on_retry(self, endpoint: str) -> None:
+        """Record a retried request."""
+
+    def on_error(self, endpoint: str, exception: Exception) -> None:
+        """Record a failed request."""
+
+
+@dataclass(kw_only=True)
+class Histogram:
+    """Histogram with fixed, cumulative upper bounds like Prometheus."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = field(default=0, init=False)
+    sum: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        """Create one counter per bucket plus one for +Inf."""
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding the q-quantile."""
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[min(index, len(self.buckets) - 1)]
+
+        return self.buckets[-1]
+
+
+@dataclass(kw_only=True)
+class InMemoryMetrics:
+    """Collector keeping per-endpoint histograms and counters in memory."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+
+    latency: dict[tuple[str, str], Histogram] = field(default_factory=dict, init=False)
+    bytes_received: Counter[str] = field(default_factory=Counter, init=False)
+    cache_hits: Counter[str] = field(default_factory=Counter, init=False)
+    retries: Counter[str] = field(default_factory=Counter, init=False)
+    errors: Counter[tuple[str, str]] = field(default_factory=Counter, init=False)
+
+    def histogram(self, endpoint: str, phase: str) -> Histogram:
+        """Return the latency histogram of a phase of an endpoint."""
+        if (histogram := self.latency.get((endpoint, phase))) is None:
+            histogram = self.latency[endpoint, phase] = Histogram(buckets=self.buckets)
+        return histogram
+
+    def on_response(
+        self,
+        endpoint: str,
+        *,
+        time_to_first_byte: float,
+        body_read: float,
+        bytes_received: int,
+    ) -> None:
+        """Record the network timings of a response."""
+        self.histogram(endpoint, "time_to_first_byte").observe(time_to_first_byte)
+        self.histogram(endpoint, "body_read").observe(body_read)
+        self.histogram(endpoint, "network").observe(time_to_first_byte + body_read)
+        self.bytes_received[endpoint] += bytes_received
+
+    def on_decode(self, endpoint: str, seconds: float) -> None:
+        """Record the time spent decoding a response."""
+        self.histogram(endpoint, "decode").observe(seconds)
+
+    def on_cache_hit(self, endpoint: str) -> None:
+        """Record a response served from the in-memory cache."""
+        self.cache_hits[endpoint] += 1
+
+    def on_retry(self, endpoint: str) -> None:
+        """Record a retried request."""
+        self.retries[endpoint] += 1
+
+    def on_error(self, endpoint: str, exception: Exception) -> None:
+        """Record a failed request."""
+        self.errors[endpoint, type(exception).__name__] += 1
@@ -1,16 +1,87 @@
 """Models to the electricitymaps.com API."""
 
-from .carbon_intensity import CarbonIntensityHistory, LatestCarbonIntensity
-from .home_assistant import HomeAssistantCarbonIntensityResponse
-from .power_breakdown import LatestPowerBreakdown, PowerBreakdownHistory
-from .zone import Zone, ZonesResponse
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .carbon_intensity import (
+        CarbonIntensity,
+        CarbonIntensityForecast,
+        CarbonIntensityHistory,
+        CarbonIntensityPastRange,
+        ForecastedCarbonIntensity,
+        LatestCarbonIntensity,
+    )
+    from .columnar import (
+        CarbonIntensityColumns,
+        CarbonIntensityForecastColumns,
+        PowerBreakdownColumns,
+    )
+    from .home_assistant import HomeAssistantCarbonIntensityResponse
+    from .power_breakdown import (
+        LatestPowerBreakdown,
+        PowerBreakdown,
+        PowerBreakdownHistory,
+        PowerBreakdownPastRange,
+    )
+    from .snapshot import ZoneSnapshot
+    from .zone import Zone, ZonesResponse
+
+# Imported on first access, so only the models in use are loaded.
+_LAZY_IMPORTS = {
+    "CarbonIntensity": ".carbon_intensity",
+    "CarbonIntensityColumns": ".columnar",
+    "CarbonIntensityForecast": ".carbon_intensity",
+    "CarbonIntensityForecastColumns": ".columnar",
+    "CarbonIntensityHistory": ".carbon_intensity",
+    "CarbonIntensityPastRange": ".carbon_intensity",
+    "ForecastedCarbonIntensity": ".carbon_intensity",
+    "HomeAssistantCarbonIntensityResponse": ".home_assistant",
+    "LatestCarbonIntensity": ".carbon_intensity",
+    "LatestPowerBreakdown": ".power_breakdown",
+    "PowerBreakdown": ".power_breakdown",
+    "PowerBreakdownColumns": ".columnar",
+    "PowerBreakdownHistory": ".power_breakdown",
+    "PowerBreakdownPastRange": ".power_breakdown",
+    "Zone": ".zone",
+    "ZoneSnapshot": ".snapshot",
+    "ZonesResponse": ".zone",
+}
 
 __all__ = [
+    "CarbonIntensity",
+    "CarbonIntensityColumns",
+    "CarbonIntensityForecast",
+    "CarbonIntensityForecastColumns",
     "CarbonIntensityHistory",
+    "CarbonIntensityPastRange",
+    "ForecastedCarbonIntensity",
     "HomeAssistantCarbonIntensityResponse",
     "LatestCarbonIntensity",
     "LatestPowerBreakdown",
+    "PowerBreakdown",
+    "PowerBreakdownColumns",
     "PowerBreakdownHistory",
+    "PowerBreakdownPastRange",
     "Zone",
+    "ZoneSnapshot",
     "ZonesResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model on first access."""
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names of the package."""
+    return sorted(__all__)
@@ -4,13 +4,18 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from mashumaro import field_options
+from mashumaro.mixins.dict import DataClassDictMixin
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+from .config import ModelConfig
+
 
 @dataclass(slots=True, frozen=True, kw_only=True)
-class CarbonIntensity:
+class CarbonIntensity(DataClassDictMixin):
     """API response."""
 
+    Config = ModelConfig
+
     carbon_intensity: int = field(metadata=field_options(alias="carbonIntensity"))
     timestamp: datetime = field(metadata=field_options(alias="datetime"))
     updated_at: datetime = field(metadata=field_options(alias="updatedAt"))
@@ -32,5 +37,36 @@ class LatestCarbonIntensity(CarbonIntensity, DataClassORJSONMixin):
 class CarbonIntensityHistory(DataClassORJSONMixin):
     """Carbon intensity history response."""
 
+    Config = ModelConfig
+
     zone: str
     history: list[CarbonIntensity]
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CarbonIntensityPastRange(DataClassORJSONMixin):
+    """Carbon intensity past range response."""
+
+    Config = ModelConfig
+
+    zone: str
+    data: list[CarbonIntensity]
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ForecastedCarbonIntensity:
+    """Forecasted carbon intensity of one hour."""
+
+    carbon_intensity: int = field(metadata=field_options(alias="carbonIntensity"))
+    timestamp: datetime = field(metadata=field_options(alias="datetime"))
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CarbonIntensityForecast(DataClassORJSONMixin):
+    """Carbon intensity forecast response."""
+
+    Config = ModelConfig
+
+    zone: str
+    forecast: list[ForecastedCarbonIntensity]
+    updated_at: datetime = field(metadata=field_options(alias="updatedAt"))
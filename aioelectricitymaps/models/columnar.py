@@ -0,0 +1,183 @@
+"""Columnar representations of the electricitymaps.com history responses."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import math
+from typing import Any, Self
+
+import orjson
+
+_NAN = math.nan
+
+
+def _epoch(value: str) -> int:
+    """Convert an ISO 8601 timestamp to epoch seconds."""
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+def _float(value: float | None) -> float:
+    """Convert an optional number to a float, mapping None to NaN."""
+    return _NAN if value is None else float(value)
+
+
+def _breakdown_columns(
+    history: list[dict[str, Any]],
+    alias: str,
+) -> dict[str, array[float]]:
+    """Build one float column per source of a breakdown, NaN where missing."""
+    sources: dict[str, None] = {}
+    for row in history:
+        sources.update(dict.fromkeys(row.get(alias) or ()))
+
+    return {
+        source: array(
+            "d",
+            (_float((row.get(alias) or {}).get(source)) for row in history),
+        )
+        for source in sources
+    }
+
+
+def nanmean(values: array[float]) -> float:
+    """Return the mean of the values, ignoring NaN."""
+    present = [value for value in values if not math.isnan(value)]
+    return math.fsum(present) / len(present) if present else _NAN
+
+
+def nanargmin(values: array[float]) -> int | None:
+    """Return the index of the smallest value, ignoring NaN."""
+    best: int | None = None
+    for index, value in enumerate(values):
+        if not math.isnan(value) and (best is None or value < values[best]):
+            best = index
+    return best
+
+
+def isnan_mask(values: array[float]) -> array[int]:
+    """Return a mask that is 1 where the value is missing."""
+    return array("b", (math.isnan(value) for value in values))
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class _HistoryColumns:
+    """Columns shared by all history responses."""
+
+    zone: str
+    timestamps: array[int]
+    is_estimated: array[int]
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.timestamps)
+
+    def datetime_at(self, index: int) -> datetime:
+        """Return the timestamp of a row as a datetime."""
+        return datetime.fromtimestamp(self.timestamps[index], tz=UTC)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CarbonIntensityColumns(_HistoryColumns):
+    """Carbon intensity history decoded into one array per field."""
+
+    carbon_intensity: array[float]
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> Self:
+        """Decode a carbon intensity history response without row objects."""
+        payload = orjson.loads(data)
+        history: list[dict[str, Any]] = payload["history"]
+        return cls(
+            zone=payload["zone"],
+            timestamps=array("q", (_epoch(row["datetime"]) for row in history)),
+            is_estimated=array("b", (bool(row["isEstimated"]) for row in history)),
+            carbon_intensity=array(
+                "d",
+                (_float(row["carbonIntensity"]) for row in history),
+            ),
+        )
+
+    def mean(self) -> float:
+        """Return the mean carbon intensity."""
+        return nanmean(self.carbon_intensity)
+
+    def min(self) -> float:
+        """Return the lowest carbon intensity."""
+        index = self.argmin()
+        return _NAN if index is None else self.carbon_intensity[index]
+
+    def argmin(self) -> int | None:
+        """Return the row index with the lowest carbon intensity."""
+        return nanargmin(self.carbon_intensity)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CarbonIntensityForecastColumns:
+    """Carbon intensity forecast decoded into one array per field."""
+
+    zone: str
+    timestamps: array[int]
+    carbon_intensity: array[float]
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> Self:
+        """Decode a carbon intensity forecast response without row objects."""
+        payload = orjson.loads(data)
+        forecast: list[dict[str, Any]] = payload["forecast"]
+        return cls(
+            zone=payload["zone"],
+            timestamps=array("q", (_epoch(row["datetime"]) for row in forecast)),
+            carbon_intensity=array(
+                "d",
+                (_float(row["carbonIntensity"]) for row in forecast),
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.timestamps)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PowerBreakdownColumns(_HistoryColumns):
+    """Power breakdown history decoded into one array per field and source."""
+
+    power_consumption_breakdown: dict[str, array[float]]
+    power_production_breakdown: dict[str, array[float]]
+    power_import_breakdown: dict[str, array[float]]
+    power_export_breakdown: dict[str, array[float]]
+    fossil_free_percentage: array[float]
+    renewable_percentage: array[float]
+    power_consumption_total: array[float]
+    power_production_total: array[float]
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> Self:
+        """Decode a power breakdown history response without row objects."""
+        payload = orjson.loads(data)
+        history: list[dict[str, Any]] = payload["history"]
+
+        def column(alias: str) -> array[float]:
+            return array("d", (_float(row.get(alias)) for row in history))
+
+        return cls(
+            zone=payload["zone"],
+            timestamps=array("q", (_epoch(row["datetime"]) for row in history)),
+            is_estimated=array("b", (bool(row["isEstimated"]) for row in history)),
+            power_consumption_breakdown=_breakdown_columns(
+                history,
+                "powerConsumptionBreakdown",
+            ),
+            power_production_breakdown=_breakdown_columns(
+                history,
+                "powerProductionBreakdown",
+            ),
+            power_import_breakdown=_breakdown_columns(history, "powerImportBreakdown"),
+            power_export_breakdown=_breakdown_columns(history, "powerExportBreakdown"),
+            fossil_free_percentage=column("fossilFreePercentage"),
+            renewable_percentage=column("renewablePercentage"),
+            power_consumption_total=column("powerConsumptionTotal"),
+            power_production_total=column("powerProductionTotal"),
+        )
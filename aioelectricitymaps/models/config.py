@@ -0,0 +1,9 @@
+"""Shared mashumaro configuration for the models."""
+
+from mashumaro.config import BaseConfig
+
+
+class ModelConfig(BaseConfig):
+    """Defer generating the decoders until a model is first used."""
+
+    lazy_compilation = True
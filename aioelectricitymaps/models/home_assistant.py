@@ -13,12 +13,15 @@ from aioelectricitymaps.exceptions import (
     ElectricityMapsError,
     ElectricityMapsNoDataError,
 )
+from aioelectricitymaps.models.config import ModelConfig
 
 
 @dataclass(slots=True, frozen=True, kw_only=True)
 class HomeAssistantCarbonIntensityResponse(DataClassORJSONMixin):
     """API response."""
 
+    Config = ModelConfig
+
     status: str
     country_code: str = field(metadata=field_options(alias="countryCode"))
     data: HomeAssistantCarbonIntensityData
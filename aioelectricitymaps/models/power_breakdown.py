@@ -6,13 +6,18 @@ from dataclasses import dataclass, field
 from datetime import datetime  # noqa: TC003
 
 from mashumaro import field_options
+from mashumaro.mixins.dict import DataClassDictMixin
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+from .config import ModelConfig
+
 
 @dataclass(slots=True, frozen=True, kw_only=True)
-class PowerBreakdown:
+class PowerBreakdown(DataClassDictMixin):
     """API response."""
 
+    Config = ModelConfig
+
     time: datetime = field(metadata=field_options(alias="datetime"))
     updated_at: datetime = field(metadata=field_options(alias="updatedAt"))
     created_at: datetime = field(metadata=field_options(alias="createdAt"))
@@ -57,5 +62,17 @@ class LatestPowerBreakdown(PowerBreakdown, DataClassORJSONMixin):
 class PowerBreakdownHistory(DataClassORJSONMixin):
     """Power breakdown response."""
 
+    Config = ModelConfig
+
     zone: str
     history: list[PowerBreakdown]
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PowerBreakdownPastRange(DataClassORJSONMixin):
+    """Power breakdown past range response."""
+
+    Config = ModelConfig
+
+    zone: str
+    data: list[PowerBreakdown]
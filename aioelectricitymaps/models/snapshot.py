@@ -0,0 +1,19 @@
+"""Combined snapshot of the latest values of a zone."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .carbon_intensity import LatestCarbonIntensity  # noqa: TC001
+from .home_assistant import HomeAssistantCarbonIntensityResponse  # noqa: TC001
+from .power_breakdown import LatestPowerBreakdown  # noqa: TC001
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ZoneSnapshot:
+    """Latest carbon intensity and power breakdown of a zone."""
+
+    zone: str
+    carbon_intensity: LatestCarbonIntensity
+    power_breakdown: LatestPowerBreakdown
+    home_assistant: HomeAssistantCarbonIntensityResponse | None = None
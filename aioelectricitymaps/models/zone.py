@@ -6,6 +6,8 @@ from typing import Any, Self
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+from .config import ModelConfig
+
 
 @dataclass(slots=True, frozen=True, kw_only=True)
 class Zone:
@@ -22,6 +24,8 @@ class Zone:
 class ZonesResponse(DataClassORJSONMixin):
     """Zones API response."""
 
+    Config = ModelConfig
+
     zones: dict[str, Zone]
 
     @classmethod
@@ -0,0 +1,230 @@
+"""Persistent response cache for the Electricity Maps client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
+
+from .const import ApiEndpoints
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class PersistentCacheBackend(Protocol):
+    """Storage for raw response bodies and the time they were fetched."""
+
+    def load(self, key: str) -> tuple[bytes, float] | None:
+        """Return the body and fetch timestamp stored for key."""
+
+    def store(self, key: str, body: bytes, fetched_at: float) -> None:
+        """Store the body and fetch timestamp for key."""
+
+    def close(self) -> None:
+        """Release the resources held by the backend."""
+
+
+@runtime_checkable
+class SharedCacheBackend(PersistentCacheBackend, Protocol):
+    """Backend shared by several processes that can hand out fetch leases."""
+
+    def claim(self, key: str, lease: float) -> bool:
+        """Claim fetching key for lease seconds, unless another process holds it."""
+
+    def release(self, key: str) -> None:
+        """Give up the claim on key."""
+
+
+class SQLiteCacheBackend:
+    """Backend storing responses in a SQLite database.
+
+    The database runs in WAL mode, so several worker processes on one host
+    can share a file while reading concurrently. Leases in the database elect
+    a single process to fetch each response.
+    """
+
+    def __init__(self, path: str | Path, *, busy_timeout: float = 5.0) -> None:
+        """Open or create the cache database at path."""
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=busy_timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)",
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS claims ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL)",
+        )
+
+    def load(self, key: str) -> tuple[bytes, float] | None:
+        """Return the body and fetch timestamp stored for key."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return None if row is None else (bytes(row[0]), row[1])
+
+    def store(self, key: str, body: bytes, fetched_at: float) -> None:
+        """Store the body and fetch timestamp for key."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO responses (key, body, fetched_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "body = excluded.body, fetched_at = excluded.fetched_at "
+                "WHERE excluded.fetched_at > responses.fetched_at",
+                (key, body, fetched_at),
+            )
+
+    def claim(self, key: str, lease: float) -> bool:
+        """Claim fetching key for lease seconds, unless another process holds it."""
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO claims (key, expires_at) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET expires_at = excluded.expires_at "
+                "WHERE claims.expires_at <= ?",
+                (key, now + lease, now),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, key: str) -> None:
+        """Give up the claim on key."""
+        with self._lock:
+            self._connection.execute("DELETE FROM claims WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def _default_max_ages() -> dict[str, float]:
+    """Return the default per-endpoint freshness lifetimes in seconds."""
+    return {ApiEndpoints.ZONES: 86400.0}
+
+
+def _default_stale_windows() -> dict[str, float]:
+    """Return the default per-endpoint stale windows in seconds."""
+    return {
+        ApiEndpoints.CARBON_INTENSITY_HA: 900.0,
+        ApiEndpoints.LATEST_CARBON_INTENSITY: 900.0,
+        ApiEndpoints.LATEST_POWER_BREAKDOWN: 900.0,
+    }
+
+
+@dataclass(kw_only=True)
+class PersistentCache:
+    """Stale-while-revalidate policy on top of a persistent backend.
+
+    Entries younger than their max age are fresh. Older entries are still
+    served for stale_while_revalidate seconds, or the stale window of their
+    endpoint, while the client refreshes them in the background. The latest
+    values are only served up to 15 minutes past their max age by default.
+
+    With a lease, processes sharing a backend elect one of them to fetch each
+    missing or stale response, while the others wait up to lease seconds for
+    it to be stored, so upstream requests don't grow with the worker count.
+
+    Backend errors are logged and the request goes to the API instead, so a
+    broken cache never fails a request.
+    """
+
+    backend: PersistentCacheBackend
+    default_max_age: float = 300.0
+    max_ages: dict[str, float] = field(default_factory=_default_max_ages)
+    stale_while_revalidate: float = 86400.0
+    stale_windows: dict[str, float] = field(default_factory=_default_stale_windows)
+    lease: float | None = None
+    poll_interval: float = 0.05
+
+    def __post_init__(self) -> None:
+        """Check the backend supports leases if they are used."""
+        if self.lease is not None and not isinstance(
+            self.backend,
+            SharedCacheBackend,
+        ):
+            msg = "A lease requires a backend implementing SharedCacheBackend"
+            raise TypeError(msg)
+
+    async def _call(self, fallback: _T, method: Callable[..., _T], *args: Any) -> _T:
+        """Run a backend method in a thread, returning fallback if it fails."""
+        try:
+            return await asyncio.to_thread(method, *args)
+        except Exception:
+            _LOGGER.exception("Persistent cache backend failed in %s", method.__name__)
+            return fallback
+
+    def max_age_for(self, url: str) -> float:
+        """Return how long responses of the given endpoint stay fresh."""
+        return self.max_ages.get(url, self.default_max_age)
+
+    async def load(self, key: str) -> tuple[bytes, float] | None:
+        """Return the stored body and its age in seconds, if still servable."""
+        entry = await self._call(None, self.backend.load, key)
+        if entry is None:
+            return None
+
+        body, fetched_at = entry
+        age = time.time() - fetched_at
+        url = key.partition("?")[0]
+        if age > self.max_age_for(url) + self.stale_window_for(url):
+            return None
+
+        return body, age
+
+    async def store(self, key: str, body: bytes) -> None:
+        """Store a freshly fetched body."""
+        await self._call(None, self.backend.store, key, body, time.time())
+
+    def stale_window_for(self, url: str) -> float:
+        """Return how long stale responses of the given endpoint are served."""
+        return self.stale_windows.get(url, self.stale_while_revalidate)
+
+    def is_fresh(self, key: str, age: float) -> bool:
+        """Check if an entry of the given age doesn't need a refresh."""
+        return age < self.max_age_for(key.partition("?")[0])
+
+    async def claim(self, key: str) -> bool:
+        """Claim fetching key for this process, always granted without a lease."""
+        if self.lease is None:
+            return True
+
+        backend: SharedCacheBackend = self.backend  # type: ignore[assignment]
+        return await self._call(True, backend.claim, key, self.lease)  # noqa: FBT003
+
+    async def release(self, key: str) -> None:
+        """Give up the claim on key."""
+        if self.lease is not None:
+            backend: SharedCacheBackend = self.backend  # type: ignore[assignment]
+            await self._call(None, backend.release, key)
+
+    async def wait_for(self, key: str) -> bytes | None:
+        """Wait for the process holding the claim on key to store it."""
+        deadline = time.monotonic() + (self.lease or 0.0)
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            if (entry := await self.load(key)) is not None and self.is_fresh(
+                key,
+                entry[1],
+            ):
+                return entry[0]
+
+        return None
@@ -0,0 +1,127 @@
+"""Background polling of the latest carbon intensity."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+import logging
+import random
+from typing import TYPE_CHECKING, Self
+
+from .exceptions import ElectricityMapsError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Sequence
+    from datetime import datetime
+
+    from .electricitymaps import ElectricityMaps
+    from .models import LatestCarbonIntensity
+    from .request import CoordinatesRequest, ZoneRequest
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class CarbonIntensityPoller:
+    """Poll the latest carbon intensity of a set of zones.
+
+    Requests are spread evenly across the interval, with each one jittered
+    inside its slot. Subscribers are only notified when updated_at changed
+    since the last poll of a zone.
+    """
+
+    client: ElectricityMaps
+    requests: Sequence[CoordinatesRequest | ZoneRequest]
+    interval: float = 3600.0
+    jitter: float = 0.5
+
+    _updated_at: dict[str, datetime] = field(default_factory=dict, init=False)
+    _callbacks: list[Callable[[LatestCarbonIntensity], None]] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    _queues: list[asyncio.Queue[LatestCarbonIntensity]] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    _task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+
+    def subscribe(
+        self,
+        callback: Callable[[LatestCarbonIntensity], None],
+    ) -> Callable[[], None]:
+        """Call callback for every change and return a function to unsubscribe."""
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    async def changes(self) -> AsyncGenerator[LatestCarbonIntensity]:
+        """Yield every changed carbon intensity."""
+        queue: asyncio.Queue[LatestCarbonIntensity] = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+
+    def start(self) -> None:
+        """Start polling in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def poll(self, request: CoordinatesRequest | ZoneRequest) -> None:
+        """Poll one zone and notify subscribers if its data changed."""
+        try:
+            result = await self.client.latest_carbon_intensity(request)
+        except ElectricityMapsError as exception:
+            _LOGGER.debug("Polling %s failed: %s", request, exception)
+            return
+
+        if self._updated_at.get(result.zone) == result.updated_at:
+            return
+
+        self._updated_at[result.zone] = result.updated_at
+        for callback in list(self._callbacks):
+            try:
+                callback(result)
+            except Exception:
+                # A broken subscriber must not stop polling for everyone else.
+                _LOGGER.exception("Error in callback for %s", result.zone)
+        for queue in self._queues:
+            queue.put_nowait(result)
+
+    async def _run(self) -> None:
+        """Poll every zone once per interval, each in its own jittered slot."""
+        loop = asyncio.get_running_loop()
+        slot = self.interval / max(len(self.requests), 1)
+
+        while True:
+            cycle_start = loop.time()
+            for index, request in enumerate(self.requests):
+                offset = index * slot + random.uniform(0, self.jitter * slot)  # noqa: S311
+                await asyncio.sleep(max(0.0, cycle_start + offset - loop.time()))
+                await self.poll(request)
+
+            await asyncio.sleep(max(0.0, cycle_start + self.interval - loop.time()))
+
+    async def __aenter__(self) -> Self:
+        """Async enter."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Async exit."""
+        await self.stop()
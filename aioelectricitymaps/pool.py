@@ -0,0 +1,60 @@
+"""Connection pool configuration for the Electricity Maps client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import socket
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+
+from .const import API_BASE_URL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class ConnectionPoolConfig:
+    """Settings for the session the client creates when none is given."""
+
+    limit: int = 100
+    limit_per_host: int = 0
+    ttl_dns_cache: int | None = 300
+    keepalive_timeout: float = 30.0
+    connect_timeout: float | None = 10.0
+    read_timeout: float | None = 30.0
+    total_timeout: float | None = 60.0
+    prewarm_connections: int = 0
+
+    def create_session(self) -> ClientSession:
+        """Create a session with a connector built from this configuration."""
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=self.ttl_dns_cache is not None,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        timeout = ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+        return ClientSession(connector=connector, timeout=timeout)
+
+    async def prewarm(self, session: ClientSession) -> None:
+        """Open keep-alive connections to the API ahead of the first requests."""
+        if self.prewarm_connections <= 0:
+            return
+
+        async def open_connection() -> None:
+            try:
+                async with session.head(API_BASE_URL) as response:
+                    await response.read()
+            except (ClientError, TimeoutError, socket.gaierror) as exception:
+                _LOGGER.debug("Pre-warming connection failed: %s", exception)
+
+        await asyncio.gather(
+            *(open_connection() for _ in range(self.prewarm_connections)),
+        )
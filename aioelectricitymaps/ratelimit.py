@@ -0,0 +1,51 @@
+"""Client-side rate limiting for the Electricity Maps client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import time
+
+
+@dataclass(kw_only=True)
+class RateLimiter:
+    """Token bucket shared by all requests of a client.
+
+    Requests that exceed the budget wait in FIFO order until a token is
+    available instead of failing.
+    """
+
+    rate: float
+    burst: int = 1
+
+    _tokens: float = field(init=False, repr=False)
+    _updated_at: float = field(init=False, repr=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._updated_at) * self.rate,
+        )
+        self._updated_at = now
+
+    def headroom(self) -> float:
+        """Return the number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
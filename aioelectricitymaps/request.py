@@ -1,31 +1,109 @@
 """Request model for electricitymaps API."""
 
-from dataclasses import asdict, dataclass
+from __future__ import annotations
 
+from dataclasses import dataclass, field
+from datetime import datetime  # noqa: TC003
+from decimal import Decimal, InvalidOperation
 
-@dataclass
+RequestKey = tuple[tuple[str, str], ...]
+
+
+def normalize_coordinate(value: str) -> str:
+    """Return a coordinate without redundant digits, e.g. 52.50 as 52.5."""
+    try:
+        number = Decimal(value.strip())
+    except InvalidOperation:
+        return value
+
+    if not number.is_finite():
+        return value
+
+    return format(number.normalize() + 0, "f")
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class BaseRequest:
-    """Base request model."""
+    """Base request model.
+
+    Requests are immutable. Their query parameters and canonical key are
+    computed once, and requests compare and hash by that key, so they can be
+    used as cache and deduplication keys directly.
+    """
+
+    _parameters: dict[str, str] = field(init=False, repr=False)
+    key: RequestKey = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Compute the query parameters and the canonical key."""
+        parameters = self._build_parameters()
+        object.__setattr__(self, "_parameters", parameters)
+        object.__setattr__(self, "key", tuple(sorted(parameters.items())))
+
+    def _build_parameters(self) -> dict[str, str]:
+        """Build the query parameters, none for the base request."""
+        return {}
 
     def get_request_parameters(self) -> dict[str, str]:
-        """Get request parameters."""
-        return asdict(self)
+        """Get request parameters, which must not be modified."""
+        return self._parameters
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two requests query the same parameters."""
+        if not isinstance(other, BaseRequest) or type(other) is not type(self):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        """Return the hash of the canonical key."""
+        return hash(self.key)
 
     def __str__(self) -> str:
         """Return string representation of the request."""
-        return str(asdict(self))
+        return str(self._parameters)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class ZoneRequest(BaseRequest):
     """Zone request model."""
 
     zone: str
 
+    def _build_parameters(self) -> dict[str, str]:
+        """Build the query parameters."""
+        return {"zone": self.zone}
+
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, frozen=True, eq=False, kw_only=True)
 class CoordinatesRequest(BaseRequest):
-    """Coordinates request model."""
+    """Coordinates request model.
+
+    Coordinates are normalized, so "52.5" and "52.50" query the same key.
+    """
 
     lat: str
     lon: str
+
+    def _build_parameters(self) -> dict[str, str]:
+        """Build the query parameters."""
+        return {
+            "lat": normalize_coordinate(self.lat),
+            "lon": normalize_coordinate(self.lon),
+        }
+
+
+@dataclass(slots=True, frozen=True, eq=False, kw_only=True)
+class PastRangeRequest(BaseRequest):
+    """Request for the entries of a zone between start and end."""
+
+    request: CoordinatesRequest | ZoneRequest
+    start: datetime
+    end: datetime
+
+    def _build_parameters(self) -> dict[str, str]:
+        """Build the query parameters."""
+        return {
+            **self.request.get_request_parameters(),
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+        }
@@ -0,0 +1,108 @@
+"""Resolve coordinates to zones learned from earlier responses."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+from .request import BaseRequest, CoordinatesRequest, RequestKey, ZoneRequest
+
+Cell = tuple[int, int]
+
+
+@dataclass(slots=True)
+class _CellState:
+    """Zone learned for one cell and the evidence for it."""
+
+    zone: str
+    points: set[RequestKey] = field(default_factory=set)
+    ambiguous: bool = False
+    rewritten: int = 0
+
+
+@dataclass(kw_only=True)
+class CoordinateZoneResolver:
+    """Rewrite coordinate requests to zone requests using a grid of cells.
+
+    The zone of a cell is learned from the zone field of responses. Once
+    min_observations distinct coordinates in a cell resolved to the same zone,
+    later coordinate requests in that cell become zone requests, so they share
+    caches and in-flight requests.
+
+    Every verify_every-th request of a resolved cell is still sent with its
+    coordinates, so a cell on a border is noticed even after it was resolved.
+    A cell that saw more than one zone is no longer rewritten.
+    """
+
+    cell_size: float = 0.05
+    min_observations: int = 3
+    verify_every: int = 10
+    max_size: int = 65536
+
+    _cells: OrderedDict[Cell, _CellState] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+
+    def cell(self, request: CoordinatesRequest) -> Cell | None:
+        """Return the grid cell of a coordinates request."""
+        try:
+            lat, lon = float(request.lat), float(request.lon)
+        except ValueError:
+            return None
+
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            return None
+
+        return math.floor(lat / self.cell_size), math.floor(lon / self.cell_size)
+
+    def resolve(self, request: BaseRequest) -> BaseRequest:
+        """Return a zone request if the zone of the coordinates is known."""
+        if not isinstance(request, CoordinatesRequest):
+            return request
+
+        if (cell := self.cell(request)) is None:
+            return request
+
+        state = self._cells.get(cell)
+        if (
+            state is None
+            or state.ambiguous
+            or len(state.points) < self.min_observations
+        ):
+            return request
+
+        self._cells.move_to_end(cell)
+        state.rewritten += 1
+        if self.verify_every and state.rewritten % self.verify_every == 0:
+            return request
+
+        return ZoneRequest(state.zone)
+
+    def learn(self, request: BaseRequest, result: Any) -> None:
+        """Remember the zone a coordinates request resolved to."""
+        zone = getattr(result, "zone", None)
+        if not isinstance(request, CoordinatesRequest) or not isinstance(zone, str):
+            return
+
+        if (cell := self.cell(request)) is None:
+            return
+
+        if (state := self._cells.get(cell)) is None:
+            state = self._cells[cell] = _CellState(zone=zone)
+        elif state.zone != zone:
+            state.ambiguous = True
+
+        if len(state.points) < self.min_observations:
+            state.points.add(request.key)
+
+        self._cells.move_to_end(cell)
+        while len(self._cells) > self.max_size:
+            self._cells.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of known cells."""
+        return len(self._cells)
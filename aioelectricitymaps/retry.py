@@ -0,0 +1,88 @@
+"""Retry policy for the Electricity Maps client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import random
+
+from aiohttp import ClientResponseError
+
+from .exceptions import (
+    ElectricityMapsConnectionError,
+    ElectricityMapsConnectionTimeoutError,
+    ElectricityMapsError,
+    ElectricityMapsRateLimitError,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _default_retry_statuses() -> frozenset[int]:
+    """Return the HTTP statuses that are retried by default."""
+    return frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(kw_only=True)
+class RetryPolicy:
+    """Retry with exponential backoff and full jitter.
+
+    A Retry-After delay given by the API is honoured up to backoff_max; if
+    the API asks to wait longer, the rate limit error is raised instead.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = field(default_factory=_default_retry_statuses)
+
+    def retry_delay(
+        self,
+        exception: ElectricityMapsError,
+        attempt: int,
+    ) -> float | None:
+        """Return the delay before the next attempt, or None to give up."""
+        if attempt >= self.max_retries or not self._is_retryable(exception):
+            return None
+
+        if (
+            isinstance(exception, ElectricityMapsRateLimitError)
+            and exception.retry_after is not None
+        ):
+            if exception.retry_after > self.backoff_max:
+                return None
+            return exception.retry_after
+
+        backoff = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, backoff)  # noqa: S311
+
+    def _is_retryable(self, exception: ElectricityMapsError) -> bool:
+        """Check if the request that raised exception may be retried."""
+        if isinstance(exception, ElectricityMapsConnectionTimeoutError):
+            return True
+
+        if not isinstance(exception, ElectricityMapsConnectionError):
+            return False
+
+        cause = exception.__cause__
+        if isinstance(cause, ClientResponseError):
+            return cause.status in self.retry_statuses
+
+        return True
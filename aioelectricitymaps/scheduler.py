@@ -0,0 +1,88 @@
+"""Find the lowest-carbon window to run a deferrable job in."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from array import array
+
+HOUR = 3600
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class GreenestWindow:
+    """Window with the lowest mean carbon intensity."""
+
+    zone: str
+    start: datetime
+    end: datetime
+    carbon_intensity: float
+
+
+def greenest_window_index(
+    timestamps: array[int],
+    carbon_intensity: array[float],
+    *,
+    size: int,
+    earliest: int,
+    latest: int,
+    step: int = HOUR,
+) -> tuple[int, float] | None:
+    """Return the start index and mean of the lowest-intensity window.
+
+    Windows are size consecutive entries, step seconds apart, starting no
+    earlier than earliest and ending no later than latest. Windows with a
+    missing (NaN) value or a gap are skipped. A running sum makes the scan
+    linear in the length of the series.
+    """
+    if size <= 0:
+        msg = "The window size must be positive"
+        raise ValueError(msg)
+
+    best: tuple[int, float] | None = None
+    total = 0.0
+    missing = 0
+    for end in range(len(timestamps)):
+        if math.isnan(value := carbon_intensity[end]):
+            missing += 1
+        else:
+            total += value
+
+        start = end - size + 1
+        if start < 0:
+            continue
+
+        if start > 0:
+            if math.isnan(dropped := carbon_intensity[start - 1]):
+                missing -= 1
+            else:
+                total -= dropped
+
+        if (
+            missing
+            or timestamps[start] < earliest
+            or timestamps[end] + step > latest
+            or timestamps[end] - timestamps[start] != (size - 1) * step
+        ):
+            continue
+
+        if best is None or total < best[1] * size:
+            best = (start, total / size)
+
+    return best
+
+
+def window_size(duration: timedelta, step: int = HOUR) -> int:
+    """Return the number of entries a job of the given duration spans."""
+    return max(1, math.ceil(duration.total_seconds() / step))
+
+
+def to_epoch(value: datetime) -> int:
+    """Convert a datetime to epoch seconds, assuming UTC if it is naive."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return math.floor(value.timestamp())
@@ -0,0 +1,310 @@
+"""Blocking facade over the async client for threaded applications."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+import threading
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from .exceptions import ElectricityMapsConnectionTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine, Iterable
+    from datetime import datetime, timedelta
+
+    from .electricitymaps import ElectricityMaps
+    from .exceptions import ElectricityMapsError
+    from .models import (
+        CarbonIntensityColumns,
+        CarbonIntensityForecast,
+        CarbonIntensityForecastColumns,
+        CarbonIntensityHistory,
+        CarbonIntensityPastRange,
+        HomeAssistantCarbonIntensityResponse,
+        LatestCarbonIntensity,
+        LatestPowerBreakdown,
+        PowerBreakdownColumns,
+        PowerBreakdownHistory,
+        PowerBreakdownPastRange,
+        Zone,
+        ZoneSnapshot,
+    )
+    from .request import CoordinatesRequest, ZoneRequest
+    from .scheduler import GreenestWindow
+    from .zone_index import ZoneIndex
+
+_T = TypeVar("_T")
+
+
+async def _collect(iterator: AsyncIterator[_T]) -> list[_T]:
+    """Collect the items of an async iterator."""
+    return [item async for item in iterator]
+
+
+@dataclass(kw_only=True)
+class SyncElectricityMaps:
+    """Blocking ElectricityMaps API client.
+
+    The async client runs on an event loop in a background thread owned by
+    this object. Methods can be called from any number of threads at once;
+    all calls share the client's session, caches and in-flight requests.
+    """
+
+    client: ElectricityMaps
+    timeout: float | None = None
+
+    _loop: asyncio.AbstractEventLoop = field(
+        default_factory=asyncio.new_event_loop,
+        init=False,
+        repr=False,
+    )
+    _thread: threading.Thread = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start the event loop thread and open the client."""
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="aioelectricitymaps",
+            daemon=True,
+        )
+        self._thread.start()
+        self._run(self.client.__aenter__())
+
+    def _run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the event loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError as exception:
+            future.cancel()
+            msg = "Timeout occurred while waiting for the Electricity Maps API"
+            raise ElectricityMapsConnectionTimeoutError(msg) from exception
+
+    def carbon_intensity_for_home_assistant(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> HomeAssistantCarbonIntensityResponse:
+        """Get carbon intensity."""
+        return self._run(
+            self.client.carbon_intensity_for_home_assistant(request, timeout=timeout)
+        )
+
+    def latest_carbon_intensity(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> LatestCarbonIntensity:
+        """Get latest carbon intensity."""
+        return self._run(self.client.latest_carbon_intensity(request, timeout=timeout))
+
+    def carbon_intensity_history(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityHistory:
+        """Get carbon intensity history."""
+        return self._run(self.client.carbon_intensity_history(request, timeout=timeout))
+
+    def carbon_intensity_history_columns(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityColumns:
+        """Get carbon intensity history decoded into arrays."""
+        return self._run(
+            self.client.carbon_intensity_history_columns(request, timeout=timeout)
+        )
+
+    def carbon_intensity_past_range(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        start: datetime,
+        end: datetime,
+        timeout: float | None = None,
+    ) -> CarbonIntensityPastRange:
+        """Get carbon intensity between start and end."""
+        return self._run(
+            self.client.carbon_intensity_past_range(
+                request,
+                start=start,
+                end=end,
+                timeout=timeout,
+            ),
+        )
+
+    def carbon_intensity_forecast(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityForecast:
+        """Get carbon intensity forecast."""
+        return self._run(
+            self.client.carbon_intensity_forecast(request, timeout=timeout)
+        )
+
+    def carbon_intensity_forecast_columns(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> CarbonIntensityForecastColumns:
+        """Get carbon intensity forecast decoded into arrays."""
+        return self._run(
+            self.client.carbon_intensity_forecast_columns(request, timeout=timeout),
+        )
+
+    def greenest_window(
+        self,
+        requests: Iterable[CoordinatesRequest | ZoneRequest],
+        *,
+        duration: timedelta,
+        deadline: datetime,
+        earliest: datetime | None = None,
+        forecast: bool = True,
+        timeout: float | None = None,
+    ) -> GreenestWindow | None:
+        """Get the zone and start time with the lowest mean carbon intensity."""
+        return self._run(
+            self.client.greenest_window(
+                requests,
+                duration=duration,
+                deadline=deadline,
+                earliest=earliest,
+                forecast=forecast,
+                timeout=timeout,
+            ),
+        )
+
+    def latest_power_breakdown(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> LatestPowerBreakdown:
+        """Get latest power breakdown."""
+        return self._run(self.client.latest_power_breakdown(request, timeout=timeout))
+
+    def power_breakdown_history(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> PowerBreakdownHistory:
+        """Get power breakdown history."""
+        return self._run(self.client.power_breakdown_history(request, timeout=timeout))
+
+    def power_breakdown_history_columns(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        timeout: float | None = None,
+    ) -> PowerBreakdownColumns:
+        """Get power breakdown history decoded into arrays."""
+        return self._run(
+            self.client.power_breakdown_history_columns(request, timeout=timeout)
+        )
+
+    def power_breakdown_past_range(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        start: datetime,
+        end: datetime,
+        timeout: float | None = None,
+    ) -> PowerBreakdownPastRange:
+        """Get power breakdown between start and end."""
+        return self._run(
+            self.client.power_breakdown_past_range(
+                request,
+                start=start,
+                end=end,
+                timeout=timeout,
+            ),
+        )
+
+    def zone_snapshot(
+        self,
+        request: CoordinatesRequest | ZoneRequest,
+        *,
+        home_assistant: bool = False,
+        timeout: float | None = None,
+    ) -> ZoneSnapshot:
+        """Get the latest carbon intensity and power breakdown of a zone at once."""
+        return self._run(
+            self.client.zone_snapshot(
+                request,
+                home_assistant=home_assistant,
+                timeout=timeout,
+            ),
+        )
+
+    def zones(self, *, timeout: float | None = None) -> dict[str, Zone]:
+        """Get a dict of zones where carbon intensity is available."""
+        return self._run(self.client.zones(timeout=timeout))
+
+    def latest_carbon_intensity_many(
+        self,
+        requests: Iterable[CoordinatesRequest | ZoneRequest],
+        *,
+        timeout: float | None = None,
+    ) -> list[
+        tuple[
+            CoordinatesRequest | ZoneRequest,
+            LatestCarbonIntensity | ElectricityMapsError,
+        ]
+    ]:
+        """Get latest carbon intensity for many zones, in order of completion."""
+        return self._run(
+            _collect(
+                self.client.latest_carbon_intensity_many(requests, timeout=timeout)
+            ),
+        )
+
+    def latest_power_breakdown_many(
+        self,
+        requests: Iterable[CoordinatesRequest | ZoneRequest],
+        *,
+        timeout: float | None = None,
+    ) -> list[
+        tuple[
+            CoordinatesRequest | ZoneRequest,
+            LatestPowerBreakdown | ElectricityMapsError,
+        ]
+    ]:
+        """Get latest power breakdown for many zones, in order of completion."""
+        return self._run(
+            _collect(
+                self.client.latest_power_breakdown_many(requests, timeout=timeout)
+            ),
+        )
+
+    def load_zone_index(self, *, timeout: float | None = None) -> ZoneIndex:
+        """Get an index of the zones, building it on first use."""
+        return self._run(self.client.load_zone_index(timeout=timeout))
+
+    def close(self) -> None:
+        """Close the client and stop the event loop thread."""
+        if self._loop.is_closed():
+            return
+
+        self._run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> Self:
+        """Enter."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Exit."""
+        self.close()
@@ -0,0 +1,99 @@
+"""Pool of API tokens for the Electricity Maps client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from .ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class TokenPool:
+    """Spread requests over several API tokens.
+
+    Every token has its own rate budget and requests go to the token with the
+    most headroom. Tokens that are rejected as invalid, or rate limited
+    repeatedly, are benched for a while instead of failing requests.
+    """
+
+    tokens: Sequence[str]
+    rate: float
+    burst: int = 1
+    bench_duration: float = 60.0
+    rate_limit_threshold: int = 3
+
+    _limiters: dict[str, RateLimiter] = field(init=False, repr=False)
+    _benched_until: dict[str, float] = field(default_factory=dict, init=False)
+    _rate_limited: Counter[str] = field(default_factory=Counter, init=False)
+
+    def __post_init__(self) -> None:
+        """Create a rate limiter per token."""
+        if not self.tokens:
+            msg = "A token pool needs at least one token"
+            raise ValueError(msg)
+
+        self._limiters = {
+            token: RateLimiter(rate=self.rate, burst=self.burst)
+            for token in self.tokens
+        }
+
+    def available(self) -> list[str]:
+        """Return the tokens that are not benched."""
+        now = time.monotonic()
+        return [
+            token for token in self.tokens if self._benched_until.get(token, 0.0) <= now
+        ]
+
+    def headroom(self) -> float:
+        """Return the budget of the available token with the most headroom."""
+        return max(
+            (self._limiters[token].headroom() for token in self.available()),
+            default=0.0,
+        )
+
+    async def acquire(self) -> str:
+        """Wait for the token with the most headroom and take its budget."""
+        available = self.available()
+        while not available:
+            # Every token is benched, wait for the first one to come back.
+            await asyncio.sleep(
+                max(0.0, min(self._benched_until.values()) - time.monotonic()),
+            )
+            available = self.available()
+
+        token = max(available, key=lambda token: self._limiters[token].headroom())
+        await self._limiters[token].acquire()
+        return token
+
+    def report_success(self, token: str) -> None:
+        """Record a successful request made with token."""
+        self._rate_limited.pop(token, None)
+
+    def report_invalid(self, token: str) -> None:
+        """Bench a token the API rejected as invalid."""
+        _LOGGER.debug("Benching token ending in %s: invalid", token[-4:])
+        self._bench(token, self.bench_duration)
+
+    def report_rate_limited(self, token: str, retry_after: float | None) -> None:
+        """Record a rate limited request, benching the token if it repeats."""
+        self._rate_limited[token] += 1
+        if retry_after is not None:
+            self._bench(token, retry_after)
+        elif self._rate_limited[token] >= self.rate_limit_threshold:
+            _LOGGER.debug("Benching token ending in %s: rate limited", token[-4:])
+            self._bench(token, self.bench_duration)
+            self._rate_limited.pop(token)
+
+    def _bench(self, token: str, duration: float) -> None:
+        """Stop using a token for duration seconds."""
+        self._benched_until[token] = time.monotonic() + duration
@@ -0,0 +1,95 @@
+"""Index over the zones of the electricitymaps.com API."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import sys
+from typing import TYPE_CHECKING
+
+from .models.zone import Zone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from .models import ZonesResponse
+
+
+class ZoneIndex:
+    """Immutable index of zones with key, prefix and country lookups.
+
+    Zone keys and names are interned, so an index can be kept around and
+    shared between clients cheaply.
+    """
+
+    __slots__ = ("_by_country", "_keys", "_zones")
+
+    def __init__(self, zones: Mapping[str, Zone]) -> None:
+        """Build the index from a mapping of zone key to zone."""
+        self._zones: dict[str, Zone] = {}
+        by_country: dict[str, list[str]] = {}
+
+        for key, zone in zones.items():
+            interned_key = sys.intern(key)
+            zone_name = sys.intern(zone.zone_name)
+            country_name = (
+                None if zone.country_name is None else sys.intern(zone.country_name)
+            )
+            self._zones[interned_key] = Zone(
+                zone_name=zone_name,
+                country_name=country_name,
+            )
+            # Zones without a country are countries themselves.
+            by_country.setdefault(country_name or zone_name, []).append(
+                interned_key,
+            )
+
+        self._keys = tuple(sorted(self._zones))
+        self._by_country = {
+            country: tuple(sorted(keys)) for country, keys in by_country.items()
+        }
+
+    @classmethod
+    def from_response(cls, response: ZonesResponse) -> ZoneIndex:
+        """Build the index from a zones response."""
+        return cls(response.zones)
+
+    def get(self, key: str) -> Zone | None:
+        """Return the zone with the given key."""
+        return self._zones.get(key)
+
+    def with_prefix(self, prefix: str) -> tuple[str, ...]:
+        """Return the sorted keys starting with prefix."""
+        start = bisect_left(self._keys, prefix)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(prefix):
+            end += 1
+        return self._keys[start:end]
+
+    def sub_zones(self, key: str) -> tuple[str, ...]:
+        """Return the keys of the sub-zones of a zone, e.g. US-* for US."""
+        return self.with_prefix(f"{key}-")
+
+    def by_country(self, country_name: str) -> tuple[str, ...]:
+        """Return the keys of all zones in a country, given its name."""
+        return self._by_country.get(country_name, ())
+
+    @property
+    def countries(self) -> tuple[str, ...]:
+        """Return the sorted names of all countries."""
+        return tuple(sorted(self._by_country))
+
+    def __getitem__(self, key: str) -> Zone:
+        """Return the zone with the given key."""
+        return self._zones[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a zone with the given key exists."""
+        return key in self._zones
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the sorted zone keys."""
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Return the number of zones."""
+        return len(self._keys)
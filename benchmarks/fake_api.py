@@ -0,0 +1,104 @@
+"""Local stand-in for the Electricity Maps v3 API used by the benchmarks."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+import orjson
+
+from aioelectricitymaps.const import ApiEndpoints
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# Endpoint attribute of ApiEndpoints, path and fixture served for it.
+ROUTES = (
+    ("CARBON_INTENSITY_HA", "/home-assistant", "response.json"),
+    ("ZONES", "/zones", "zones.json"),
+    (
+        "LATEST_CARBON_INTENSITY",
+        "/carbon-intensity/latest",
+        "latest_carbon_intensity.json",
+    ),
+    (
+        "HISTORY_CARBON_INTENSITY",
+        "/carbon-intensity/history",
+        "carbon_intensity_history.json",
+    ),
+    (
+        "FORECAST_CARBON_INTENSITY",
+        "/carbon-intensity/forecast",
+        "carbon_intensity_forecast.json",
+    ),
+    (
+        "LATEST_POWER_BREAKDOWN",
+        "/power-breakdown/latest",
+        "latest_power_breakdown.json",
+    ),
+    (
+        "HISTORY_POWER_BREAKDOWN",
+        "/power-breakdown/history",
+        "power_breakdown_history.json",
+    ),
+)
+
+
+def load_fixture(filename: str) -> bytes:
+    """Load a fixture as bytes."""
+    return (FIXTURES / filename).read_bytes()
+
+
+def _handler(filename: str) -> Any:
+    """Return a handler serving a fixture with the zone of the request."""
+    payload = orjson.loads(load_fixture(filename))
+    default = orjson.dumps(payload)
+
+    async def handle(request: web.Request) -> web.Response:
+        zone = request.query.get("zone")
+        if zone is None or not isinstance(payload, dict) or "zone" not in payload:
+            body = default
+        else:
+            body = orjson.dumps({**payload, "zone": zone})
+        return web.Response(body=body, content_type="application/json")
+
+    return handle
+
+
+def create_app() -> web.Application:
+    """Create the fake API application."""
+    app = web.Application()
+    for _, path, filename in ROUTES:
+        app.router.add_get(f"/v3{path}", _handler(filename))
+    return app
+
+
+@asynccontextmanager
+async def serve() -> AsyncIterator[str]:
+    """Run the fake API on a free local port and yield its base URL."""
+    runner = web.AppRunner(create_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}/v3"
+    finally:
+        await runner.cleanup()
+
+
+@contextmanager
+def local_endpoints(base_url: str) -> Iterator[None]:
+    """Point the client's endpoints at base_url."""
+    original = {name: getattr(ApiEndpoints, name) for name, _, _ in ROUTES}
+    for name, path, _ in ROUTES:
+        setattr(ApiEndpoints, name, base_url + path)
+    try:
+        yield
+    finally:
+        for name, url in original.items():
+            setattr(ApiEndpoints, name, url)
@@ -0,0 +1,73 @@
+"""Benchmark the cost of importing aioelectricitymaps.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the median
+time spent importing modules beyond interpreter startup.
+
+    python -m benchmarks.import_time --runs 20 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PACKAGE = "aioelectricitymaps"
+
+
+def _top_level_imports(statement: str) -> dict[str, int]:
+    """Return the cumulative import time of each top-level import in microseconds."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    imports = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # Nested imports are indented and already part of their parent's time.
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+
+    return imports
+
+
+def measure(statement: str) -> int:
+    """Return the time statement spends importing modules in microseconds."""
+    startup = _top_level_imports("pass")
+    return sum(
+        cumulative
+        for name, cumulative in _top_level_imports(statement).items()
+        if name not in startup
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    results = {
+        name: statistics.median(measure(statement) for _ in range(args.runs))
+        for name, statement in (
+            ("import", f"import {PACKAGE}"),
+            ("import_client", f"from {PACKAGE} import ElectricityMaps"),
+        )
+    }
+
+    if args.json:
+        print(json.dumps(results))  # noqa: T201
+        return
+
+    for name, microseconds in results.items():
+        print(f"{name:<16} {microseconds / 1000:8.2f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
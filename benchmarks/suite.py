@@ -0,0 +1,178 @@
+"""Benchmark decoding and request throughput against a local fake API.
+
+Results can be saved with ``--output`` and compared with ``--compare`` to
+evaluate a change across commits:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+from pathlib import Path
+import platform
+import time
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from aioelectricitymaps import ElectricityMaps, ZoneRequest
+from aioelectricitymaps.models import (
+    CarbonIntensityColumns,
+    CarbonIntensityHistory,
+    HomeAssistantCarbonIntensityResponse,
+    LatestCarbonIntensity,
+    LatestPowerBreakdown,
+    PowerBreakdownColumns,
+    PowerBreakdownHistory,
+    ZonesResponse,
+)
+
+from .fake_api import load_fixture, local_endpoints, serve
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+DECODERS: tuple[tuple[Any, str], ...] = (
+    (HomeAssistantCarbonIntensityResponse, "response.json"),
+    (LatestCarbonIntensity, "latest_carbon_intensity.json"),
+    (CarbonIntensityHistory, "carbon_intensity_history.json"),
+    (CarbonIntensityColumns, "carbon_intensity_history.json"),
+    (LatestPowerBreakdown, "latest_power_breakdown.json"),
+    (PowerBreakdownHistory, "power_breakdown_history.json"),
+    (PowerBreakdownColumns, "power_breakdown_history.json"),
+    (ZonesResponse, "zones.json"),
+)
+
+
+def bench_decode(repeat: int) -> dict[str, float]:
+    """Return the best time in microseconds to decode each model."""
+    results = {}
+    for model, filename in DECODERS:
+        body = load_fixture(filename)
+        model.from_json(body)  # generate the decoder outside of the timing
+        timer = timeit.Timer(functools.partial(model.from_json, body))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[model.__name__] = best * 1e6
+    return results
+
+
+def bench_decode_memory() -> dict[str, int]:
+    """Return the peak memory in bytes allocated while decoding each model."""
+    results = {}
+    for model, filename in DECODERS:
+        body = load_fixture(filename)
+        model.from_json(body)
+        tracemalloc.start()
+        model.from_json(body)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[model.__name__] = peak
+    return results
+
+
+async def _measure(
+    name: str,
+    results: dict[str, float],
+    requests: int,
+    run: Callable[[], Awaitable[None]],
+) -> None:
+    """Run a workload and store its throughput and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results[f"{name}_requests_per_second"] = requests / elapsed
+    results[f"{name}_peak_memory"] = peak
+
+
+async def bench_requests(single_requests: int) -> dict[str, float]:
+    """Return request throughput and peak memory against the fake API."""
+    results: dict[str, float] = {}
+    zones = list(orjson.loads(load_fixture("zones.json")))
+
+    async with serve() as base_url:
+        with local_endpoints(base_url):
+            async with ElectricityMaps(
+                token="benchmark",  # noqa: S106
+                conditional_requests=False,
+            ) as client:
+
+                async def single_zone() -> None:
+                    for _ in range(single_requests):
+                        await client.latest_carbon_intensity(ZoneRequest("DE"))
+
+                async def all_zones() -> None:
+                    async for _ in client.latest_carbon_intensity_many(
+                        ZoneRequest(zone) for zone in zones
+                    ):
+                        pass
+
+                async def all_zones_history() -> None:
+                    semaphore = asyncio.Semaphore(client.max_concurrency)
+
+                    async def fetch(zone: str) -> None:
+                        async with semaphore:
+                            await client.power_breakdown_history(ZoneRequest(zone))
+
+                    await asyncio.gather(*(fetch(zone) for zone in zones))
+
+                await client.zones()  # open the connections before measuring
+                await _measure("single_zone", results, single_requests, single_zone)
+                await _measure("all_zones", results, len(zones), all_zones)
+                await _measure(
+                    "all_zones_power_breakdown_history",
+                    results,
+                    len(zones),
+                    all_zones_history,
+                )
+
+    return results
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print the relative change of every result against a baseline."""
+    for section, values in current.items():
+        if not isinstance(values, dict):
+            continue
+        print(f"\n{section}")  # noqa: T201
+        for name, value in values.items():
+            before = baseline.get(section, {}).get(name)
+            change = f"{(value - before) / before:+8.1%}" if before else "     new"
+            print(f"  {name:<52} {value:14.2f} {change}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--single-requests", type=int, default=500)
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="compare with saved results")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "decode_microseconds": bench_decode(args.repeat),
+        "decode_peak_memory": bench_decode_memory(),
+        "requests": asyncio.run(bench_requests(args.single_requests)),
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+    compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
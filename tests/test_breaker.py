@@ -0,0 +1,148 @@
+"""Tests for the circuit breaker."""
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import (
+    CircuitBreaker,
+    ElectricityMaps,
+    ElectricityMapsCircuitOpenError,
+    ElectricityMapsConnectionError,
+    ElectricityMapsInvalidTokenError,
+    ZoneRequest,
+)
+
+from . import load_fixture
+
+BASE_URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest"
+URL = f"{BASE_URL}?zone=DE"
+
+
+async def test_circuit_opens_and_serves_last_known_good(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test an open circuit fails fast with the last good result."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    electricitymaps_client.circuit_breaker = breaker
+    responses.get(URL, status=200, body=load_fixture("latest_carbon_intensity.json"))
+    responses.get(URL, status=500, repeat=True)
+
+    good = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    for _ in range(2):
+        with pytest.raises(ElectricityMapsConnectionError):
+            await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    with pytest.raises(ElectricityMapsCircuitOpenError) as exc_info:
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert exc_info.value.last_known_good is good
+    assert exc_info.value.stale_for is not None
+    assert exc_info.value.retry_after is not None
+    assert 0 < exc_info.value.retry_after <= 60
+    assert breaker.is_open(BASE_URL)
+    assert sum(len(calls) for calls in responses.requests.values()) == 3
+
+
+async def test_half_open_probe_closes_circuit(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a successful probe after the reset timeout closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    electricitymaps_client.circuit_breaker = breaker
+    responses.get(URL, status=500)
+    responses.get(URL, status=500)
+    responses.get(URL, status=200, body=load_fixture("latest_carbon_intensity.json"))
+
+    with pytest.raises(ElectricityMapsConnectionError):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    assert breaker.is_open(BASE_URL)
+
+    # A failed probe reopens the circuit.
+    with pytest.raises(ElectricityMapsConnectionError):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    assert breaker.is_open(BASE_URL)
+
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    assert not breaker.is_open(BASE_URL)
+
+
+async def test_other_errors_do_not_open_circuit(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test errors unrelated to the health of the API are not counted."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    electricitymaps_client.circuit_breaker = breaker
+    responses.get(URL, status=401)
+
+    with pytest.raises(ElectricityMapsInvalidTokenError):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert not breaker.is_open(BASE_URL)
+
+
+async def test_client_errors_do_not_open_circuit(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test repeated 404s for one zone don't fail requests for other zones."""
+    breaker = CircuitBreaker(failure_threshold=2)
+    electricitymaps_client.circuit_breaker = breaker
+    responses.get(f"{BASE_URL}?zone=BAD", status=404, repeat=True)
+    responses.get(URL, status=200, body=load_fixture("latest_carbon_intensity.json"))
+
+    for _ in range(5):
+        with pytest.raises(ElectricityMapsConnectionError):
+            await electricitymaps_client.latest_carbon_intensity(ZoneRequest("BAD"))
+
+    assert not breaker.is_open(BASE_URL)
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+
+async def test_per_zone_circuits(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a failing zone doesn't open the circuit of other zones."""
+    breaker = CircuitBreaker(failure_threshold=1, per_zone=True)
+    electricitymaps_client.circuit_breaker = breaker
+    responses.get(URL, status=503)
+    responses.get(
+        f"{BASE_URL}?zone=FR",
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    with pytest.raises(ElectricityMapsConnectionError):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("FR"))
+
+    with pytest.raises(ElectricityMapsCircuitOpenError) as exc_info:
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    assert exc_info.value.last_known_good is None
+    assert breaker.is_open(breaker.circuit_for(BASE_URL, ZoneRequest("DE")))
+    assert not breaker.is_open(breaker.circuit_for(BASE_URL, ZoneRequest("FR")))
+
+
+async def test_circuits_are_bounded(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test healthy circuits are dropped and failing ones limited to max_size."""
+    breaker = CircuitBreaker(per_zone=True, max_size=2)
+    electricitymaps_client.circuit_breaker = breaker
+    for zone in ("A", "B", "C"):
+        responses.get(f"{BASE_URL}?zone={zone}", status=503)
+    responses.get(URL, status=200, body=load_fixture("latest_carbon_intensity.json"))
+
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    assert not breaker._circuits
+
+    for zone in ("A", "B", "C"):
+        with pytest.raises(ElectricityMapsConnectionError):
+            await electricitymaps_client.latest_carbon_intensity(ZoneRequest(zone))
+    assert list(breaker._circuits) == [
+        breaker.circuit_for(BASE_URL, ZoneRequest(zone)) for zone in ("B", "C")
+    ]
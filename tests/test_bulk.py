@@ -0,0 +1,91 @@
+"""Tests for bulk multi-zone requests."""
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import ElectricityMaps, ZoneRequest
+from aioelectricitymaps.exceptions import ElectricityMapsConnectionError
+from aioelectricitymaps.models import LatestCarbonIntensity, LatestPowerBreakdown
+
+from . import load_fixture
+
+BASE_URL = "https://api.electricitymaps.com/v3"
+
+
+async def test_latest_carbon_intensity_many(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test results and errors are yielded per request."""
+    responses.get(
+        f"{BASE_URL}/carbon-intensity/latest?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+    responses.get(f"{BASE_URL}/carbon-intensity/latest?zone=FR", status=500)
+
+    requests = [ZoneRequest("DE"), ZoneRequest("FR")]
+    many = electricitymaps_client.latest_carbon_intensity_many(requests)
+    results = {str(request): result async for request, result in many}
+
+    assert isinstance(results[str(requests[0])], LatestCarbonIntensity)
+    assert isinstance(results[str(requests[1])], ElectricityMapsConnectionError)
+
+
+async def test_latest_power_breakdown_many(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test power breakdown for many zones."""
+    responses.get(
+        f"{BASE_URL}/power-breakdown/latest?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_power_breakdown.json"),
+    )
+
+    results = [
+        result
+        async for _, result in electricitymaps_client.latest_power_breakdown_many(
+            [ZoneRequest("DE")],
+        )
+    ]
+
+    assert len(results) == 1
+    assert isinstance(results[0], LatestPowerBreakdown)
+
+
+async def test_many_limits_concurrency(
+    electricitymaps_client: ElectricityMaps,
+) -> None:
+    """Test no more than max_concurrency requests are in flight."""
+    electricitymaps_client.max_concurrency = 2
+    in_flight = 0
+    peak = 0
+
+    async def fake_latest(request: ZoneRequest, **_kwargs: Any) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return request.zone
+
+    with patch.object(
+        electricitymaps_client,
+        "latest_carbon_intensity",
+        side_effect=fake_latest,
+    ):
+        results = [
+            result
+            async for _, result in electricitymaps_client.latest_carbon_intensity_many(
+                [ZoneRequest(str(i)) for i in range(6)],
+            )
+        ]
+
+    assert sorted(map(str, results)) == [str(i) for i in range(6)]
+    assert peak == 2
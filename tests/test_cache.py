@@ -0,0 +1,82 @@
+"""Tests for the response cache."""
+
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import ElectricityMaps, ResponseCache, ZoneRequest
+from aioelectricitymaps.const import ApiEndpoints
+
+from . import load_fixture
+
+
+async def test_cached_response(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a cached response is served without another request."""
+    electricitymaps_client.cache = ResponseCache()
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    first = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    second = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert first is second
+    assert electricitymaps_client.cache.hits == 1
+    assert electricitymaps_client.cache.misses == 1
+
+
+def test_ttl_expiry() -> None:
+    """Test entries expire after their endpoint TTL."""
+    cache = ResponseCache(default_ttl=10)
+    key = (
+        ApiEndpoints.LATEST_CARBON_INTENSITY,
+        (("zone", "DE"),),
+        "LatestCarbonIntensity",
+    )
+
+    with patch("aioelectricitymaps.cache.time.monotonic", return_value=0):
+        cache.set(key, "value")
+    with patch("aioelectricitymaps.cache.time.monotonic", return_value=9):
+        assert cache.get(key) == "value"
+    with patch("aioelectricitymaps.cache.time.monotonic", return_value=10):
+        assert cache.get(key) is None
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.ttl_for(ApiEndpoints.ZONES) == 86400
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used entry is evicted."""
+    cache = ResponseCache(max_size=2)
+    first = (
+        ApiEndpoints.LATEST_CARBON_INTENSITY,
+        (("zone", "DE"),),
+        "LatestCarbonIntensity",
+    )
+    second = (
+        ApiEndpoints.LATEST_CARBON_INTENSITY,
+        (("zone", "FR"),),
+        "LatestCarbonIntensity",
+    )
+    third = (
+        ApiEndpoints.LATEST_CARBON_INTENSITY,
+        (("zone", "NL"),),
+        "LatestCarbonIntensity",
+    )
+
+    cache.set(first, 1)
+    cache.set(second, 2)
+    assert cache.get(first) == 1
+    cache.set(third, 3)
+
+    assert len(cache) == 2
+    assert cache.get(second) is None
+    assert cache.get(first) == 1
+    assert cache.get(third) == 3
@@ -0,0 +1,80 @@
+"""Tests for coalescing identical in-flight requests."""
+
+import asyncio
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import ElectricityMaps, ZoneRequest
+from aioelectricitymaps.exceptions import ElectricityMapsConnectionError
+
+from . import load_fixture
+
+URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+async def test_identical_requests_share_one_call(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test concurrent identical calls are sent once."""
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    results = await asyncio.gather(
+        *(
+            electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+            for _ in range(10)
+        ),
+    )
+
+    assert all(result is results[0] for result in results)
+    assert len(responses.requests) == 1
+    assert not electricitymaps_client._in_flight
+
+
+async def test_errors_reach_every_waiter(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test an error of the shared call is raised to every waiter."""
+    responses.get(URL, status=500, body="Boooom!")
+
+    results = await asyncio.gather(
+        electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE")),
+        electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ElectricityMapsConnectionError) for r in results)
+
+
+async def test_cancelled_waiter_keeps_shared_call(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test cancelling one waiter doesn't cancel the shared call."""
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    first = asyncio.create_task(
+        electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE")),
+    )
+    second = asyncio.create_task(
+        electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE")),
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert (await second).zone == "US-CAR-DUK"
+    assert len(responses.requests) == 1
@@ -0,0 +1,70 @@
+"""Tests for the columnar history models."""
+
+from array import array
+from datetime import UTC, datetime
+import math
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import ElectricityMaps, ZoneRequest
+from aioelectricitymaps.models.columnar import isnan_mask, nanargmin, nanmean
+
+from . import load_fixture
+
+
+async def test_carbon_intensity_history_columns(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test carbon intensity history is decoded into arrays."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/history?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("carbon_intensity_history.json"),
+    )
+
+    columns = await electricitymaps_client.carbon_intensity_history_columns(
+        ZoneRequest("DE"),
+    )
+
+    assert columns.zone == "DE"
+    assert len(columns) == 24
+    assert columns.timestamps.typecode == "q"
+    assert columns.datetime_at(0) == datetime(2024, 3, 5, 20, tzinfo=UTC)
+    assert columns.min() == 492
+    assert columns.argmin() == 15
+    assert math.isclose(columns.mean(), 14399 / 24)
+
+
+async def test_power_breakdown_history_columns(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test power breakdown history is decoded into arrays."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/power-breakdown/history?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("power_breakdown_history.json"),
+    )
+
+    columns = await electricitymaps_client.power_breakdown_history_columns(
+        ZoneRequest("DE"),
+    )
+
+    assert columns.zone == "DE"
+    assert len(columns) == 24
+    assert columns.power_consumption_breakdown["coal"][0] == 21057
+    assert all(isnan_mask(columns.power_production_breakdown["nuclear"]))
+    assert columns.power_import_breakdown["CZ"][0] == 783
+
+
+def test_nan_aware_stats() -> None:
+    """Test the statistics ignore missing values."""
+    values = array("d", [math.nan, 3.0, 1.0, math.nan])
+
+    assert nanmean(values) == 2
+    assert nanargmin(values) == 2
+    assert nanargmin(array("d", [math.nan])) is None
+    assert math.isnan(nanmean(array("d")))
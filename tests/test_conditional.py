@@ -0,0 +1,122 @@
+"""Tests for conditional requests."""
+
+from aioresponses import aioresponses
+from yarl import URL
+
+from aioelectricitymaps import ElectricityMaps, ZoneRequest
+
+from . import load_fixture
+
+LATEST_URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+def _sent_headers(responses: aioresponses) -> list[dict[str, str]]:
+    """Return the headers of every request sent to LATEST_URL."""
+    return [
+        call.kwargs["headers"] for call in responses.requests[("GET", URL(LATEST_URL))]
+    ]
+
+
+async def test_not_modified_reuses_result(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a 304 response returns the previously decoded result."""
+    electricitymaps_client.conditional_requests = True
+    responses.get(
+        LATEST_URL,
+        status=200,
+        headers={"ETag": '"abc"', "Last-Modified": "Wed, 06 Mar 2024 18:48:27 GMT"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+    responses.get(LATEST_URL, status=304)
+
+    first = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    second = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert second is first
+    headers = _sent_headers(responses)
+    assert "If-None-Match" not in headers[0]
+    assert headers[1]["If-None-Match"] == '"abc"'
+    assert headers[1]["If-Modified-Since"] == "Wed, 06 Mar 2024 18:48:27 GMT"
+
+
+async def test_unchanged_body_reuses_result(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test an identical body without validators isn't decoded again."""
+    electricitymaps_client.conditional_requests = True
+    responses.get(
+        LATEST_URL,
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+        repeat=True,
+    )
+
+    first = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    second = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert second is first
+    assert "If-None-Match" not in _sent_headers(responses)[1]
+
+
+async def test_changed_body_is_decoded(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a changed body is decoded."""
+    electricitymaps_client.conditional_requests = True
+    body = load_fixture("latest_carbon_intensity.json")
+    responses.get(LATEST_URL, status=200, body=body)
+    responses.get(
+        LATEST_URL,
+        status=200,
+        body=body.replace('"carbonIntensity": 216', '"carbonIntensity": 1'),
+    )
+
+    first = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    second = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert first.carbon_intensity == 216
+    assert second.carbon_intensity == 1
+
+
+async def test_disabled(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test nothing is remembered without conditional requests, the default."""
+    responses.get(
+        LATEST_URL,
+        status=200,
+        headers={"ETag": '"abc"'},
+        body=load_fixture("latest_carbon_intensity.json"),
+        repeat=True,
+    )
+
+    first = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    second = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert second is not first
+    assert "If-None-Match" not in _sent_headers(responses)[1]
+    assert not electricitymaps_client._validated
+
+
+async def test_zones_are_not_shared(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test every call of zones returns its own dict."""
+    electricitymaps_client.conditional_requests = True
+    responses.get(
+        "https://api.electricitymaps.com/v3/zones",
+        status=200,
+        body=load_fixture("zones.json"),
+        repeat=True,
+    )
+
+    first = await electricitymaps_client.zones()
+    first.clear()
+
+    assert await electricitymaps_client.zones()
@@ -1,10 +1,23 @@
 """Tests for the electricitymaps.com client."""
 
+import asyncio
+import logging
+from typing import Any
+from unittest.mock import patch
+
 from aioresponses import aioresponses
 import pytest
 from syrupy.assertion import SnapshotAssertion
+from yarl import URL
 
-from aioelectricitymaps import CoordinatesRequest, ElectricityMaps, ZoneRequest
+from aioelectricitymaps import (
+    CircuitBreaker,
+    CoordinatesRequest,
+    ElectricityMaps,
+    ResponseCache,
+    ZoneRequest,
+)
+from aioelectricitymaps.electricitymaps import _Response
 from aioelectricitymaps.exceptions import (
     ElectricityMapsConnectionError,
     ElectricityMapsConnectionTimeoutError,
@@ -12,6 +25,7 @@ from aioelectricitymaps.exceptions import (
     ElectricityMapsInvalidTokenError,
     ElectricityMapsNoDataError,
 )
+from aioelectricitymaps.models import CarbonIntensity
 
 from . import load_fixture
 
@@ -92,6 +106,57 @@ async def test_timeout(
         )
 
 
+async def test_call_timeout(electricitymaps_client: ElectricityMaps) -> None:
+    """Test a per-call timeout cancels a slow request nobody else awaits."""
+    cancelled = asyncio.Event()
+
+    async def slow_send(**_kwargs: Any) -> None:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with (
+        patch.object(electricitymaps_client, "_send", side_effect=slow_send),
+        pytest.raises(ElectricityMapsConnectionTimeoutError),
+    ):
+        await electricitymaps_client.latest_carbon_intensity(
+            ZoneRequest("DE"),
+            timeout=0.01,
+        )
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert not electricitymaps_client._in_flight
+    assert not electricitymaps_client._waiters
+
+
+async def test_call_timeout_keeps_shared_request(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a timed out call doesn't cancel a request others wait for."""
+    body = load_fixture("latest_carbon_intensity.json").encode()
+
+    async def slow_send(**_kwargs: Any) -> _Response:
+        await asyncio.sleep(0.05)
+        return _Response(status=200, body=body)
+
+    with patch.object(electricitymaps_client, "_send", side_effect=slow_send):
+        patient = asyncio.create_task(
+            electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE")),
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(ElectricityMapsConnectionTimeoutError):
+            await electricitymaps_client.latest_carbon_intensity(
+                ZoneRequest("DE"),
+                timeout=0.01,
+            )
+
+        assert (await patient).carbon_intensity == 216
+    assert not responses.requests
+
+
 async def test_invalid_token(
     electricitymaps_client: ElectricityMaps,
     responses: aioresponses,
@@ -213,3 +278,127 @@ async def test_carbon_intensity_history(
         )
         == snapshot
     )
+
+
+async def test_debug_logging(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the response body is logged when debug logging is enabled."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+    with caplog.at_level(logging.DEBUG, logger="aioelectricitymaps"):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert "Doing request: GET" in caplog.text
+    assert '"zone": "US-CAR-DUK"' in caplog.text
+
+
+async def test_iter_carbon_intensity_history(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test iterating carbon intensity history entries."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/history?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("carbon_intensity_history.json"),
+        repeat=True,
+    )
+
+    entries = [
+        entry
+        async for entry in electricitymaps_client.iter_carbon_intensity_history(
+            ZoneRequest("DE"),
+        )
+    ]
+
+    history = await electricitymaps_client.carbon_intensity_history(ZoneRequest("DE"))
+    assert entries == history.history
+
+
+async def test_iter_power_breakdown_history(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test iterating power breakdown history entries."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/power-breakdown/history?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("power_breakdown_history.json"),
+        repeat=True,
+    )
+
+    entries = [
+        entry
+        async for entry in electricitymaps_client.iter_power_breakdown_history(
+            ZoneRequest("DE"),
+        )
+    ]
+
+    history = await electricitymaps_client.power_breakdown_history(ZoneRequest("DE"))
+    assert entries == history.history
+
+
+async def test_iter_history_shares_requests(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test concurrent history iterations share one request."""
+    url = "https://api.electricitymaps.com/v3/carbon-intensity/history?zone=DE"
+    responses.get(
+        url,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("carbon_intensity_history.json"),
+    )
+
+    async def collect() -> list[CarbonIntensity]:
+        return [
+            entry
+            async for entry in electricitymaps_client.iter_carbon_intensity_history(
+                ZoneRequest("DE"),
+            )
+        ]
+
+    first, second = await asyncio.gather(collect(), collect())
+
+    assert first == second
+    assert len(responses.requests[("GET", URL(url))]) == 1
+
+
+async def test_iter_history_is_not_retained(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test iterated history is kept by neither the caches nor the breaker."""
+    electricitymaps_client.cache = ResponseCache()
+    electricitymaps_client.circuit_breaker = CircuitBreaker()
+    electricitymaps_client.conditional_requests = True
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/history?zone=DE",
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("carbon_intensity_history.json"),
+        repeat=True,
+    )
+
+    for _ in range(2):
+        entries = [
+            entry
+            async for entry in electricitymaps_client.iter_carbon_intensity_history(
+                ZoneRequest("DE"),
+            )
+        ]
+
+    assert len(entries) == 24
+    assert len(electricitymaps_client.cache) == 0
+    assert not electricitymaps_client._validated
+    assert not electricitymaps_client.circuit_breaker._last_good
@@ -0,0 +1,160 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from aioelectricitymaps import (
+    ElectricityMaps,
+    ElectricityMapsConnectionError,
+    HedgePolicy,
+    RateLimiter,
+    TokenPool,
+    ZoneRequest,
+)
+from aioelectricitymaps.electricitymaps import _Response
+
+from . import load_fixture
+
+URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest"
+
+
+def test_delay_follows_quantile() -> None:
+    """Test the initial delay is used until enough responses were seen."""
+    hedge = HedgePolicy(quantile=0.9, initial_delay=2, min_samples=10)
+
+    assert hedge.delay(URL) == 2
+    for _ in range(9):
+        hedge.observe(URL, 0.02)
+    assert hedge.delay(URL) == 2
+    hedge.observe(URL, 0.3)
+
+    assert hedge.delay(URL) == 0.02
+    assert hedge.delay("other") == 2
+
+
+def test_delay_follows_recent_responses() -> None:
+    """Test a slow period is forgotten once the window moved past it."""
+    hedge = HedgePolicy(quantile=0.5, min_samples=1, window=10)
+
+    for _ in range(10):
+        hedge.observe(URL, 5)
+    assert hedge.delay(URL) == 5
+
+    for _ in range(10):
+        hedge.observe(URL, 0.3)
+    assert hedge.delay(URL) == 0.3
+
+
+async def test_hedged_request_wins(electricitymaps_client: ElectricityMaps) -> None:
+    """Test a duplicate is sent for a slow request and the fastest one wins."""
+    electricitymaps_client.hedge = HedgePolicy(initial_delay=0.01)
+    body = load_fixture("latest_carbon_intensity.json").encode()
+    calls = 0
+
+    async def send(**_kwargs: Any) -> _Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1 if calls == 1 else 0)
+        return _Response(status=200, body=body)
+
+    start = time.perf_counter()
+    with patch.object(electricitymaps_client, "_send", side_effect=send):
+        result = await electricitymaps_client.latest_carbon_intensity(
+            ZoneRequest("DE"),
+        )
+
+    assert result.carbon_intensity == 216
+    assert calls == 2
+    assert time.perf_counter() - start < 0.5
+
+
+async def test_fast_request_is_not_hedged(
+    electricitymaps_client: ElectricityMaps,
+) -> None:
+    """Test no duplicate is sent for requests answering within the delay."""
+    electricitymaps_client.hedge = HedgePolicy(initial_delay=1)
+    body = load_fixture("latest_carbon_intensity.json").encode()
+
+    with patch.object(
+        electricitymaps_client,
+        "_send",
+        return_value=_Response(status=200, body=body),
+    ) as send:
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert send.call_count == 1
+
+
+async def test_hedge_respects_rate_limit(
+    electricitymaps_client: ElectricityMaps,
+) -> None:
+    """Test no duplicate is sent without a spare rate limit token."""
+    electricitymaps_client.hedge = HedgePolicy(initial_delay=0.01)
+    electricitymaps_client.rate_limiter = RateLimiter(rate=0.001, burst=1)
+
+    async def send(**_kwargs: Any) -> _Response:
+        await asyncio.sleep(0.05)
+        msg = "Slow failure"
+        raise ElectricityMapsConnectionError(msg)
+
+    with (
+        patch.object(electricitymaps_client, "_send", side_effect=send) as mock,
+        pytest.raises(ElectricityMapsConnectionError),
+    ):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert mock.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("pool_tokens", "expected"),
+    [(["a", "b"], ["a", "b"]), (["a"], ["a"])],
+)
+async def test_hedge_takes_a_token_from_the_pool(
+    pool_tokens: list[str],
+    expected: list[str],
+) -> None:
+    """Test a duplicate uses its own token, and only with budget to spare."""
+    body = load_fixture("latest_carbon_intensity.json").encode()
+    tokens: list[str] = []
+
+    async def send(**kwargs: Any) -> _Response:
+        tokens.append(kwargs["headers"]["auth-token"])
+        await asyncio.sleep(0.05 if len(tokens) == 1 else 0)
+        return _Response(status=200, body=body)
+
+    client = ElectricityMaps(
+        token_pool=TokenPool(tokens=pool_tokens, rate=0.001, burst=1),
+        hedge=HedgePolicy(initial_delay=0.01),
+    )
+    with patch.object(client, "_send", side_effect=send):
+        await client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert tokens == expected
+    await client.close()
+
+
+async def test_failed_hedges_raise_first_error(
+    electricitymaps_client: ElectricityMaps,
+) -> None:
+    """Test the first error is raised when every attempt fails."""
+    electricitymaps_client.hedge = HedgePolicy(initial_delay=0.01)
+    calls = 0
+
+    async def send(**_kwargs: Any) -> _Response:
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.05 if call == 1 else 0.1)
+        msg = f"Failure {call}"
+        raise ElectricityMapsConnectionError(msg)
+
+    with (
+        patch.object(electricitymaps_client, "_send", side_effect=send),
+        pytest.raises(ElectricityMapsConnectionError, match="Failure 1"),
+    ):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
@@ -0,0 +1,126 @@
+"""Tests for the incremental history stores."""
+
+from datetime import UTC, datetime, timedelta
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import (
+    CarbonIntensityHistoryStore,
+    ElectricityMaps,
+    PowerBreakdownHistoryStore,
+    ZoneRequest,
+)
+from aioelectricitymaps.history import _HistoryStore
+from aioelectricitymaps.models import CarbonIntensityHistory
+
+from . import load_fixture
+
+BASE_URL = "https://api.electricitymaps.com/v3"
+HISTORY_URL = f"{BASE_URL}/carbon-intensity/history?zone=DE"
+NOW = datetime(2024, 3, 6, 20, 30, tzinfo=UTC)
+
+
+async def test_first_sync_fetches_full_history(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test the first sync of a zone returns every entry."""
+    responses.get(
+        HISTORY_URL,
+        status=200,
+        body=load_fixture("carbon_intensity_history.json"),
+    )
+    store = CarbonIntensityHistoryStore(client=electricitymaps_client)
+
+    delta = await store.sync(ZoneRequest("DE"), now=NOW)
+
+    assert len(delta) == 24
+    assert store.history("DE") == delta
+
+
+async def test_sync_fetches_only_outdated_hours(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test later syncs fetch from the first estimated hour and return the delta."""
+    responses.get(
+        HISTORY_URL,
+        status=200,
+        body=load_fixture("carbon_intensity_history.json"),
+    )
+    responses.get(
+        f"{BASE_URL}/carbon-intensity/past-range?zone=DE"
+        "&start=2024-03-06T18:00:00%2B00:00&end=2024-03-06T20:30:00%2B00:00",
+        status=200,
+        body=load_fixture("carbon_intensity_past_range.json"),
+    )
+    store = CarbonIntensityHistoryStore(client=electricitymaps_client)
+    await store.sync(ZoneRequest("DE"), now=NOW)
+
+    delta = await store.sync(ZoneRequest("DE"), now=NOW)
+
+    assert [(entry.timestamp.hour, entry.carbon_intensity) for entry in delta] == [
+        (19, 671),
+        (20, 702),
+    ]
+    assert not delta[0].is_estimated
+    history = store.history("DE")
+    assert len(history) == 24
+    assert history[0].timestamp == datetime(2024, 3, 5, 21, tzinfo=UTC)
+    assert history[-1].timestamp == datetime(2024, 3, 6, 20, tzinfo=UTC)
+
+
+async def test_sync_without_past_range(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test syncing with the full history returns only the changed entries."""
+    responses.get(
+        f"{BASE_URL}/power-breakdown/history?zone=DE",
+        status=200,
+        body=load_fixture("power_breakdown_history.json"),
+        repeat=True,
+    )
+    store = PowerBreakdownHistoryStore(
+        client=electricitymaps_client,
+        past_range=False,
+    )
+
+    assert len(await store.sync(ZoneRequest("DE"), now=NOW)) == 24
+    assert await store.sync(ZoneRequest("DE"), now=NOW) == []
+
+
+def test_merge_replaces_only_changed_entries() -> None:
+    """Test merging skips unchanged entries and keeps the window sorted."""
+    history = CarbonIntensityHistory.from_json(
+        load_fixture("carbon_intensity_history.json"),
+    ).history
+    store = CarbonIntensityHistoryStore(client=None)  # type: ignore[arg-type]
+
+    assert store.merge("DE", history[12:]) == history[12:]
+    assert store.merge("DE", history) == history[:12]
+    assert store.merge("DE", history) == []
+    assert store.history("DE") == history
+    assert store.first_outdated("DE", NOW) == datetime(2024, 3, 6, 18, tzinfo=UTC)
+
+
+def test_first_outdated_of_complete_window() -> None:
+    """Test nothing is outdated once every hour of the window is final."""
+    history = CarbonIntensityHistory.from_json(
+        load_fixture("carbon_intensity_history.json"),
+    ).history
+    store = CarbonIntensityHistoryStore(
+        client=None,  # type: ignore[arg-type]
+        window=timedelta(hours=22),
+    )
+    store.merge("DE", history[:22])
+
+    assert store.first_outdated("DE", datetime(2024, 3, 6, 17, 5, tzinfo=UTC)) is None
+    assert store.first_outdated("DE", NOW) == datetime(2024, 3, 6, 18, tzinfo=UTC)
+
+
+def test_base_store_is_abstract(electricitymaps_client: ElectricityMaps) -> None:
+    """Test the base store can't be used without its endpoint methods."""
+    with pytest.raises(TypeError):
+        _HistoryStore(client=electricitymaps_client)  # type: ignore[abstract]
@@ -0,0 +1,76 @@
+"""Tests for the instrumentation hooks."""
+
+from unittest.mock import AsyncMock, patch
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import (
+    ElectricityMaps,
+    InMemoryMetrics,
+    ResponseCache,
+    RetryPolicy,
+    ZoneRequest,
+)
+from aioelectricitymaps.exceptions import ElectricityMapsConnectionError
+from aioelectricitymaps.metrics import Histogram
+
+from . import load_fixture
+
+ENDPOINT = "https://api.electricitymaps.com/v3/carbon-intensity/latest"
+URL = f"{ENDPOINT}?zone=DE"
+
+
+async def test_request_metrics(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test network, decode and cache metrics are recorded per endpoint."""
+    metrics = InMemoryMetrics()
+    electricitymaps_client.metrics = metrics
+    electricitymaps_client.cache = ResponseCache()
+    body = load_fixture("latest_carbon_intensity.json")
+    responses.get(URL, status=200, body=body)
+
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert metrics.histogram(ENDPOINT, "network").count == 1
+    assert metrics.histogram(ENDPOINT, "time_to_first_byte").count == 1
+    assert metrics.histogram(ENDPOINT, "decode").count == 1
+    assert metrics.bytes_received[ENDPOINT] == len(body)
+    assert metrics.cache_hits[ENDPOINT] == 1
+
+
+async def test_error_and_retry_metrics(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test errors are counted by exception class along with retries."""
+    metrics = InMemoryMetrics()
+    electricitymaps_client.metrics = metrics
+    electricitymaps_client.retry = RetryPolicy(max_retries=1)
+    responses.get(URL, status=500, repeat=True)
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        pytest.raises(ElectricityMapsConnectionError),
+    ):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert metrics.errors[ENDPOINT, "ElectricityMapsConnectionError"] == 2
+    assert metrics.retries[ENDPOINT] == 1
+
+
+def test_histogram_quantile() -> None:
+    """Test quantiles are resolved to bucket upper bounds."""
+    histogram = Histogram(buckets=(0.1, 0.5, 1.0))
+    assert histogram.quantile(0.5) is None
+
+    for value in (0.05, 0.05, 0.3, 0.7, 5):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.6) == 0.5
+    assert histogram.quantile(0.99) == 1.0
@@ -0,0 +1,37 @@
+"""Tests for the package entry point."""
+
+import subprocess
+import sys
+
+import pytest
+
+import aioelectricitymaps
+from aioelectricitymaps import models
+
+
+def test_import_is_lazy() -> None:
+    """Test importing the package doesn't load aiohttp or the models."""
+    code = (
+        "import sys, aioelectricitymaps; "
+        "assert 'aiohttp' not in sys.modules; "
+        "assert 'aioelectricitymaps.models.power_breakdown' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_lazy_attributes() -> None:
+    """Test public names resolve on first access."""
+    for name in aioelectricitymaps.__all__:
+        assert getattr(aioelectricitymaps, name) is not None
+    for name in models.__all__:
+        assert getattr(models, name) is not None
+
+    assert dir(aioelectricitymaps) == sorted(aioelectricitymaps.__all__)
+
+
+def test_unknown_attribute() -> None:
+    """Test unknown names raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = aioelectricitymaps.DoesNotExist
+    with pytest.raises(AttributeError):
+        _ = models.DoesNotExist
@@ -0,0 +1,236 @@
+"""Tests for the persistent response cache."""
+
+import asyncio
+from pathlib import Path
+import time
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import (
+    ElectricityMaps,
+    PersistentCache,
+    SQLiteCacheBackend,
+    ZoneRequest,
+)
+
+from . import load_fixture
+
+URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+def test_sqlite_backend(tmp_path: Path) -> None:
+    """Test the SQLite backend keeps the newest entry across connections."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    backend.store("key", b"new", 2)
+    backend.store("key", b"old", 1)
+    backend.close()
+
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    assert backend.load("key") == (b"new", 2)
+    assert backend.load("missing") is None
+    backend.close()
+
+
+async def test_miss_is_stored_and_served(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test a fetched response is stored and served on the next call."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    electricitymaps_client.persistent_cache = PersistentCache(backend=backend)
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    first = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    second = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert first == second
+    assert sum(len(calls) for calls in responses.requests.values()) == 1
+    assert backend.load(URL) is not None
+
+
+async def test_stale_entry_is_revalidated(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test a stale entry is served while it is refreshed in the background."""
+    body = load_fixture("latest_carbon_intensity.json").encode()
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    backend.store(
+        URL,
+        body.replace(b'"carbonIntensity": 216', b'"carbonIntensity": 1'),
+        time.time() - 600,
+    )
+    electricitymaps_client.persistent_cache = PersistentCache(backend=backend)
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=body,
+    )
+
+    stale = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    await asyncio.gather(*electricitymaps_client._background_tasks)
+
+    assert stale.carbon_intensity == 1
+    stored = backend.load(URL)
+    assert stored is not None
+    assert stored[0] == body
+    assert not electricitymaps_client._refreshing
+
+
+async def test_expired_entry_is_ignored(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test entries past the stale window are fetched again."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    backend.store(URL, b"{}", time.time() - 3600)
+    electricitymaps_client.persistent_cache = PersistentCache(
+        backend=backend,
+        stale_windows={},
+        stale_while_revalidate=60,
+    )
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    result = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert result.carbon_intensity == 216
+
+
+async def test_old_latest_values_are_not_served(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test the latest values are fetched again after their short stale window."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    backend.store(URL, b"{}", time.time() - 3600)
+    electricitymaps_client.persistent_cache = PersistentCache(backend=backend)
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    result = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert result.carbon_intensity == 216
+
+
+def test_sqlite_backend_claims(tmp_path: Path) -> None:
+    """Test only one connection at a time holds the claim on a key."""
+    first = SQLiteCacheBackend(tmp_path / "cache.db")
+    second = SQLiteCacheBackend(tmp_path / "cache.db")
+
+    assert first.claim("key", 60)
+    assert not second.claim("key", 60)
+    assert second.claim("other", 60)
+    first.release("key")
+    assert second.claim("key", 60)
+    assert second.claim("expired", -1)
+    assert first.claim("expired", 60)
+
+    first.close()
+    second.close()
+
+
+def test_lease_requires_shared_backend() -> None:
+    """Test a lease is refused for backends without claims."""
+    with pytest.raises(TypeError):
+        PersistentCache(backend=object(), lease=5)  # type: ignore[arg-type]
+
+
+async def test_follower_waits_for_claimed_fetch(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test a process waits for the process fetching a response to store it."""
+    leader = SQLiteCacheBackend(tmp_path / "cache.db")
+    follower = SQLiteCacheBackend(tmp_path / "cache.db")
+    electricitymaps_client.persistent_cache = PersistentCache(
+        backend=follower,
+        lease=5,
+        poll_interval=0.01,
+    )
+    assert leader.claim(URL, 5)
+
+    task = asyncio.create_task(
+        electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE")),
+    )
+    await asyncio.sleep(0.05)
+    leader.store(
+        URL, load_fixture("latest_carbon_intensity.json").encode(), time.time()
+    )
+    leader.release(URL)
+
+    assert (await task).carbon_intensity == 216
+    assert not responses.requests
+
+
+async def test_stale_entry_refreshed_by_one_process(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test a stale entry is not refreshed while another process holds it."""
+    leader = SQLiteCacheBackend(tmp_path / "cache.db")
+    follower = SQLiteCacheBackend(tmp_path / "cache.db")
+    leader.store(
+        URL,
+        load_fixture("latest_carbon_intensity.json").encode(),
+        time.time() - 600,
+    )
+    electricitymaps_client.persistent_cache = PersistentCache(
+        backend=follower,
+        lease=5,
+    )
+    assert leader.claim(URL, 5)
+
+    await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+    await asyncio.gather(*electricitymaps_client._background_tasks)
+
+    assert not responses.requests
+    assert not follower.claim(URL, 5)
+
+
+async def test_backend_errors_fall_back_to_the_api(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing backend is logged and bypassed."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.db")
+    backend.close()
+    electricitymaps_client.persistent_cache = PersistentCache(
+        backend=backend,
+        lease=5,
+    )
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    result = await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert result.carbon_intensity == 216
+    assert "Persistent cache backend failed in load" in caplog.text
+    assert "Persistent cache backend failed in store" in caplog.text
@@ -0,0 +1,131 @@
+"""Tests for the carbon intensity poller."""
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import CarbonIntensityPoller, ElectricityMaps, ZoneRequest
+
+from . import load_fixture
+
+if TYPE_CHECKING:
+    from aioelectricitymaps.models import LatestCarbonIntensity
+
+URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+async def test_only_changes_are_published(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test subscribers are only notified when updated_at changed."""
+    body = load_fixture("latest_carbon_intensity.json")
+    responses.get(URL, status=200, body=body)
+    responses.get(URL, status=200, body=body)
+    responses.get(
+        URL,
+        status=200,
+        body=body.replace("2024-03-06T18:48:27.926Z", "2024-03-06T19:48:27.926Z"),
+    )
+    poller = CarbonIntensityPoller(
+        client=electricitymaps_client,
+        requests=[ZoneRequest("DE")],
+    )
+    changes: list[LatestCarbonIntensity] = []
+    unsubscribe = poller.subscribe(changes.append)
+
+    for _ in range(3):
+        await poller.poll(ZoneRequest("DE"))
+    unsubscribe()
+    await poller.poll(ZoneRequest("DE"))
+
+    assert [change.updated_at.hour for change in changes] == [18, 19]
+
+
+async def test_failed_poll_is_skipped(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a failing zone doesn't notify subscribers."""
+    responses.get(URL, status=500)
+    poller = CarbonIntensityPoller(
+        client=electricitymaps_client,
+        requests=[ZoneRequest("DE")],
+    )
+    callback = Mock()
+    poller.subscribe(callback)
+
+    await poller.poll(ZoneRequest("DE"))
+
+    callback.assert_not_called()
+
+
+async def test_background_polling(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test zones are polled in the background and streamed to iterators."""
+    responses.get(
+        URL,
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+        repeat=True,
+    )
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=FR",
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json").replace(
+            "US-CAR-DUK",
+            "FR",
+        ),
+        repeat=True,
+    )
+
+    async with CarbonIntensityPoller(
+        client=electricitymaps_client,
+        requests=[ZoneRequest("DE"), ZoneRequest("FR")],
+        interval=0.05,
+    ) as poller:
+        changes = poller.changes()
+        zones = {(await anext(changes)).zone for _ in range(2)}
+        await asyncio.sleep(0.1)
+        await changes.aclose()
+
+    assert zones == {"US-CAR-DUK", "FR"}
+    assert sum(len(calls) for calls in responses.requests.values()) >= 4
+    assert poller._task is None
+
+
+async def test_raising_callback_keeps_polling(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a callback that raises doesn't stop later polls or subscribers."""
+    body = load_fixture("latest_carbon_intensity.json")
+    responses.get(URL, status=200, body=body)
+    responses.get(
+        URL,
+        status=200,
+        body=body.replace("2024-03-06T18:48:27.926Z", "2024-03-06T19:48:27.926Z"),
+        repeat=True,
+    )
+    changes: list[LatestCarbonIntensity] = []
+
+    async with CarbonIntensityPoller(
+        client=electricitymaps_client,
+        requests=[ZoneRequest("DE")],
+        interval=0.02,
+        jitter=0,
+    ) as poller:
+        poller.subscribe(Mock(side_effect=RuntimeError("Boom")))
+        poller.subscribe(changes.append)
+        await asyncio.sleep(0.1)
+        assert poller._task is not None
+        assert not poller._task.done()
+
+    assert [change.updated_at.hour for change in changes] == [18, 19]
+    assert caplog.text.count("Error in callback for US-CAR-DUK") == 2
@@ -0,0 +1,53 @@
+"""Tests for the connection pool configuration."""
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import ConnectionPoolConfig, ElectricityMaps
+
+
+async def test_create_session() -> None:
+    """Test the session is built from the pool configuration."""
+    config = ConnectionPoolConfig(
+        limit=20,
+        limit_per_host=5,
+        connect_timeout=2,
+        read_timeout=3,
+        total_timeout=None,
+    )
+
+    async with config.create_session() as session:
+        assert session.connector is not None
+        assert session.connector.limit == 20
+        assert session.connector.limit_per_host == 5
+        assert session.timeout.connect == 2
+        assert session.timeout.sock_read == 3
+        assert session.timeout.total is None
+
+
+async def test_owned_session_uses_pool(responses: aioresponses) -> None:
+    """Test the client builds and closes its own session from the pool."""
+    responses.head("https://api.electricitymaps.com/v3", status=404, repeat=True)
+
+    async with ElectricityMaps(
+        token="abc123",
+        pool=ConnectionPoolConfig(limit=7, prewarm_connections=3),
+    ) as em:
+        assert em.session is not None
+        assert em.session.connector is not None
+        assert em.session.connector.limit == 7
+
+    assert em.session.closed
+    assert sum(len(calls) for calls in responses.requests.values()) == 3
+
+
+async def test_no_prewarm_for_given_session(responses: aioresponses) -> None:
+    """Test a session passed by the caller is not pre-warmed."""
+    config = ConnectionPoolConfig(prewarm_connections=3)
+
+    async with (
+        config.create_session() as session,
+        ElectricityMaps(token="abc123", session=session, pool=config),
+    ):
+        pass
+
+    assert not responses.requests
@@ -0,0 +1,78 @@
+"""Tests for the request models."""
+
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime
+
+import pytest
+
+from aioelectricitymaps import CoordinatesRequest, ZoneRequest
+from aioelectricitymaps.request import (
+    BaseRequest,
+    PastRangeRequest,
+    normalize_coordinate,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("52.50", "52.5"),
+        ("52.5", "52.5"),
+        (" 13.400 ", "13.4"),
+        ("50", "50"),
+        ("1e2", "100"),
+        ("-0.0", "0"),
+        ("abc", "abc"),
+        ("nan", "nan"),
+    ],
+)
+def test_normalize_coordinate(value: str, expected: str) -> None:
+    """Test coordinates are normalized without changing their value."""
+    assert normalize_coordinate(value) == expected
+
+
+def test_coordinates_request_key() -> None:
+    """Test equivalent coordinates share the parameters, key and hash."""
+    first = CoordinatesRequest(lat="52.50", lon="13.400")
+    second = CoordinatesRequest(lat="52.5", lon="13.4")
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.get_request_parameters() == {"lat": "52.5", "lon": "13.4"}
+    assert first.key == (("lat", "52.5"), ("lon", "13.4"))
+    assert first.get_request_parameters() is first.get_request_parameters()
+
+
+def test_base_request_has_no_parameters() -> None:
+    """Test the base request queries no parameters."""
+    request = BaseRequest()
+
+    assert request.get_request_parameters() == {}
+    assert request.key == ()
+
+
+def test_requests_are_frozen_and_hashable() -> None:
+    """Test requests can be used as keys but not modified."""
+    request = ZoneRequest("DE")
+
+    assert {request: 1}[ZoneRequest("DE")] == 1
+    assert request != ZoneRequest("FR")
+    assert request != CoordinatesRequest(lat="1", lon="2")
+    assert str(request) == "{'zone': 'DE'}"
+    with pytest.raises(FrozenInstanceError):
+        request.zone = "FR"  # type: ignore[misc]
+
+
+def test_past_range_request() -> None:
+    """Test past range requests combine the zone and range parameters."""
+    request = PastRangeRequest(
+        request=ZoneRequest("DE"),
+        start=datetime(2024, 3, 6, 18, tzinfo=UTC),
+        end=datetime(2024, 3, 6, 20, tzinfo=UTC),
+    )
+
+    assert request.key == (
+        ("end", "2024-03-06T20:00:00+00:00"),
+        ("start", "2024-03-06T18:00:00+00:00"),
+        ("zone", "DE"),
+    )
@@ -0,0 +1,107 @@
+"""Tests for the coordinates to zone resolver."""
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import (
+    CoordinatesRequest,
+    CoordinateZoneResolver,
+    ElectricityMaps,
+    ZoneRequest,
+)
+from aioelectricitymaps.models import LatestCarbonIntensity
+
+from . import load_fixture
+
+BASE_URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest"
+
+
+class _Result:
+    """Response with a zone field."""
+
+    def __init__(self, zone: str) -> None:
+        """Initialize with a zone."""
+        self.zone = zone
+
+
+def test_learn_and_resolve() -> None:
+    """Test coordinates resolve once enough distinct points agree on a zone."""
+    resolver = CoordinateZoneResolver(cell_size=0.5, verify_every=0)
+    request = CoordinatesRequest(lat="52.52", lon="13.40")
+
+    assert resolver.resolve(request) is request
+    resolver.learn(request, _Result("DE"))
+    resolver.learn(CoordinatesRequest(lat="52.520", lon="13.4"), _Result("DE"))
+    resolver.learn(CoordinatesRequest(lat="52.6", lon="13.3"), _Result("DE"))
+    assert resolver.resolve(request) is request
+
+    resolver.learn(CoordinatesRequest(lat="52.7", lon="13.2"), _Result("DE"))
+    assert resolver.resolve(request) == ZoneRequest("DE")
+    nearby_cell = CoordinatesRequest(lat="53.1", lon="13.2")
+    assert resolver.resolve(nearby_cell) is nearby_cell
+
+
+def test_resolved_cells_are_verified() -> None:
+    """Test a sample of requests in a resolved cell keep their coordinates."""
+    resolver = CoordinateZoneResolver(cell_size=1, min_observations=1, verify_every=3)
+    request = CoordinatesRequest(lat="47.5", lon="7.6")
+    resolver.learn(request, _Result("CH"))
+
+    assert [resolver.resolve(request) for _ in range(3)] == [
+        ZoneRequest("CH"),
+        ZoneRequest("CH"),
+        request,
+    ]
+
+
+def test_border_cells_are_not_resolved() -> None:
+    """Test cells that saw more than one zone stay coordinate requests."""
+    resolver = CoordinateZoneResolver(cell_size=1, min_observations=1)
+    request = CoordinatesRequest(lat="47.5", lon="7.6")
+
+    resolver.learn(request, _Result("CH"))
+    assert resolver.resolve(request) == ZoneRequest("CH")
+
+    resolver.learn(CoordinatesRequest(lat="47.6", lon="7.7"), _Result("DE"))
+    resolver.learn(request, _Result("CH"))
+
+    assert resolver.resolve(request) is request
+
+
+def test_ignored_inputs() -> None:
+    """Test invalid coordinates, zone requests and zone-less results."""
+    resolver = CoordinateZoneResolver(max_size=1)
+
+    resolver.learn(CoordinatesRequest(lat="abc", lon="1"), _Result("DE"))
+    resolver.learn(CoordinatesRequest(lat="nan", lon="1"), _Result("DE"))
+    resolver.learn(ZoneRequest("DE"), _Result("DE"))
+    resolver.learn(CoordinatesRequest(lat="1", lon="1"), object())
+    assert len(resolver) == 0
+
+    resolver.learn(CoordinatesRequest(lat="1", lon="1"), _Result("A"))
+    resolver.learn(CoordinatesRequest(lat="2", lon="2"), _Result("B"))
+    assert len(resolver) == 1
+
+
+async def test_client_rewrites_coordinates(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test the client sends zone requests for known coordinates."""
+    electricitymaps_client.zone_resolver = CoordinateZoneResolver()
+    body = load_fixture("latest_carbon_intensity.json")
+    points = [("35.2271", "-80.8431"), ("35.2275", "-80.8435"), ("35.2283", "-80.8446")]
+    for lat, lon in points:
+        responses.get(f"{BASE_URL}?lat={lat}&lon={lon}", status=200, body=body)
+    responses.get(f"{BASE_URL}?zone=US-CAR-DUK", status=200, body=body)
+
+    for lat, lon in points:
+        first = await electricitymaps_client.latest_carbon_intensity(
+            CoordinatesRequest(lat=lat, lon=lon),
+        )
+    second = await electricitymaps_client.latest_carbon_intensity(
+        CoordinatesRequest(lat="35.2290", lon="-80.8400"),
+    )
+
+    assert isinstance(first, LatestCarbonIntensity)
+    assert second.zone == "US-CAR-DUK"
+    assert len(responses.requests) == 4
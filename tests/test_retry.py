@@ -0,0 +1,133 @@
+"""Tests for rate limiting and retries."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import ElectricityMaps, RateLimiter, RetryPolicy, ZoneRequest
+from aioelectricitymaps.exceptions import (
+    ElectricityMapsConnectionError,
+    ElectricityMapsInvalidTokenError,
+    ElectricityMapsRateLimitError,
+)
+from aioelectricitymaps.retry import parse_retry_after
+
+from . import load_fixture
+
+URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+async def test_retry_honours_retry_after(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a 429 is retried after the delay given by the API."""
+    electricitymaps_client.retry = RetryPolicy()
+    responses.get(URL, status=429, headers={"Retry-After": "7"})
+    responses.get(
+        URL,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        result = await electricitymaps_client.latest_carbon_intensity(
+            ZoneRequest("DE"),
+        )
+
+    assert result.zone == "US-CAR-DUK"
+    sleep.assert_awaited_once_with(7.0)
+
+
+async def test_retry_gives_up(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test retries stop after max_retries."""
+    electricitymaps_client.retry = RetryPolicy(max_retries=2)
+    responses.get(URL, status=429, repeat=True)
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock) as sleep,
+        pytest.raises(ElectricityMapsRateLimitError),
+    ):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert sleep.await_count == 2
+    assert sum(len(calls) for calls in responses.requests.values()) == 3
+
+
+@pytest.mark.parametrize(
+    ("status", "expected_exception"),
+    [
+        (401, ElectricityMapsInvalidTokenError),
+        (404, ElectricityMapsConnectionError),
+    ],
+)
+async def test_no_retry_for_client_errors(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+    status: int,
+    expected_exception: type[Exception],
+) -> None:
+    """Test client errors are not retried."""
+    electricitymaps_client.retry = RetryPolicy()
+    responses.get(URL, status=status)
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock) as sleep,
+        pytest.raises(expected_exception),
+    ):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    sleep.assert_not_awaited()
+
+
+def test_backoff_is_bounded() -> None:
+    """Test the backoff grows exponentially up to backoff_max."""
+    policy = RetryPolicy(max_retries=10, backoff_base=1, backoff_max=5)
+    exception = ElectricityMapsConnectionError("Boom")
+
+    with patch("aioelectricitymaps.retry.random.uniform", side_effect=max):
+        assert [policy.retry_delay(exception, i) for i in range(4)] == [1, 2, 4, 5]
+    assert policy.retry_delay(exception, 10) is None
+
+
+async def test_retry_after_beyond_backoff_max(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a Retry-After longer than backoff_max is raised, not slept."""
+    electricitymaps_client.retry = RetryPolicy(backoff_max=30)
+    responses.get(URL, status=429, headers={"Retry-After": "3600"})
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock) as sleep,
+        pytest.raises(ElectricityMapsRateLimitError) as exc_info,
+    ):
+        await electricitymaps_client.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert exc_info.value.retry_after == 3600
+    sleep.assert_not_awaited()
+
+
+def test_parse_retry_after() -> None:
+    """Test parsing of the Retry-After header."""
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+async def test_rate_limiter_queues() -> None:
+    """Test requests over the budget wait for a token."""
+    limiter = RateLimiter(rate=100, burst=2)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    assert loop.time() - start >= 0.015
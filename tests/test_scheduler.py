@@ -0,0 +1,146 @@
+"""Tests for the greenest window scheduler."""
+
+from array import array
+from datetime import UTC, datetime, timedelta
+import math
+
+from aioresponses import aioresponses
+import pytest
+
+from aioelectricitymaps import (
+    ElectricityMaps,
+    ElectricityMapsInvalidTokenError,
+    GreenestWindow,
+    ZoneRequest,
+)
+from aioelectricitymaps.scheduler import greenest_window_index, window_size
+
+from . import load_fixture
+
+BASE_URL = "https://api.electricitymaps.com/v3/carbon-intensity"
+START = datetime(2024, 3, 6, 20, tzinfo=UTC)
+DEADLINE = datetime(2024, 3, 7, 20, tzinfo=UTC)
+
+
+def _series(values: list[float], gap_at: int | None = None) -> "array[int]":
+    """Return hourly timestamps, skipping an hour before gap_at."""
+    return array(
+        "q",
+        (
+            i * 3600 + (3600 if gap_at is not None and i >= gap_at else 0)
+            for i in range(len(values))
+        ),
+    )
+
+
+def test_greenest_window_index() -> None:
+    """Test the lowest window respects bounds, gaps and missing values."""
+    values = [5.0, 1.0, 2.0, math.nan, 0.0, 0.0, 9.0]
+    intensity = array("d", values)
+    timestamps = _series(values)
+
+    assert greenest_window_index(
+        timestamps,
+        intensity,
+        size=2,
+        earliest=0,
+        latest=7 * 3600,
+    ) == (4, 0.0)
+    assert greenest_window_index(
+        timestamps,
+        intensity,
+        size=2,
+        earliest=0,
+        latest=5 * 3600,
+    ) == (1, 1.5)
+    assert greenest_window_index(
+        _series(values, gap_at=5),
+        intensity,
+        size=2,
+        earliest=0,
+        latest=8 * 3600,
+    ) == (1, 1.5)
+    assert (
+        greenest_window_index(timestamps, intensity, size=8, earliest=0, latest=10**6)
+        is None
+    )
+    with pytest.raises(ValueError, match="positive"):
+        greenest_window_index(timestamps, intensity, size=0, earliest=0, latest=0)
+
+
+def test_window_size() -> None:
+    """Test job durations round up to whole entries."""
+    assert window_size(timedelta(minutes=90)) == 2
+    assert window_size(timedelta(hours=3)) == 3
+    assert window_size(timedelta(0)) == 1
+
+
+async def test_greenest_window_from_forecast(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test the greenest window over the forecasts of several zones."""
+    body = load_fixture("carbon_intensity_forecast.json")
+    responses.get(f"{BASE_URL}/forecast?zone=DE", status=200, body=body)
+    responses.get(
+        f"{BASE_URL}/forecast?zone=FR",
+        status=200,
+        body=body.replace('"zone": "DE"', '"zone": "FR"').replace(
+            '"carbonIntensity": 198',
+            '"carbonIntensity": 98',
+        ),
+    )
+    responses.get(f"{BASE_URL}/forecast?zone=PL", status=401)
+
+    window = await electricitymaps_client.greenest_window(
+        [ZoneRequest("DE"), ZoneRequest("FR"), ZoneRequest("PL")],
+        duration=timedelta(hours=3),
+        earliest=START,
+        deadline=DEADLINE,
+    )
+
+    assert window == GreenestWindow(
+        zone="FR",
+        start=datetime(2024, 3, 7, 7, tzinfo=UTC),
+        end=datetime(2024, 3, 7, 10, tzinfo=UTC),
+        carbon_intensity=(214 + 98 + 205) / 3,
+    )
+
+
+async def test_greenest_window_from_history(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test the history of the last day is used as the next day's profile."""
+    responses.get(
+        f"{BASE_URL}/history?zone=DE",
+        status=200,
+        body=load_fixture("carbon_intensity_history.json"),
+    )
+
+    window = await electricitymaps_client.greenest_window(
+        [ZoneRequest("DE")],
+        duration=timedelta(hours=1),
+        earliest=START,
+        deadline=DEADLINE,
+        forecast=False,
+    )
+
+    assert window is not None
+    assert window.zone == "DE"
+    assert START <= window.start < DEADLINE
+
+
+async def test_greenest_window_raises_if_every_zone_fails(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test the error is raised if no zone could be fetched."""
+    responses.get(f"{BASE_URL}/forecast?zone=DE", status=401)
+
+    with pytest.raises(ElectricityMapsInvalidTokenError):
+        await electricitymaps_client.greenest_window(
+            [ZoneRequest("DE")],
+            duration=timedelta(hours=1),
+            deadline=DEADLINE,
+        )
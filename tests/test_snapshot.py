@@ -0,0 +1,75 @@
+"""Tests for zone snapshots."""
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import ElectricityMaps, ResponseCache, ZoneRequest
+from aioelectricitymaps.models import ZoneSnapshot
+
+from . import load_fixture
+
+BASE_URL = "https://api.electricitymaps.com/v3"
+
+
+def _mock_latest(responses: aioresponses) -> None:
+    """Mock the latest endpoints of a zone."""
+    responses.get(
+        f"{BASE_URL}/carbon-intensity/latest?zone=DE",
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+        repeat=True,
+    )
+    responses.get(
+        f"{BASE_URL}/power-breakdown/latest?zone=DE",
+        status=200,
+        body=load_fixture("latest_power_breakdown.json"),
+        repeat=True,
+    )
+
+
+async def test_zone_snapshot(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a snapshot combines the latest values of a zone."""
+    _mock_latest(responses)
+
+    snapshot = await electricitymaps_client.zone_snapshot(ZoneRequest("DE"))
+
+    assert isinstance(snapshot, ZoneSnapshot)
+    assert snapshot.zone == "US-CAR-DUK"
+    assert snapshot.carbon_intensity.carbon_intensity == 216
+    assert snapshot.power_breakdown.zone == "DE"
+    assert snapshot.home_assistant is None
+    assert snapshot == await electricitymaps_client.zone_snapshot(ZoneRequest("DE"))
+
+
+async def test_zone_snapshot_is_cached(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test a cached snapshot is served without requests."""
+    _mock_latest(responses)
+    responses.get(
+        f"{BASE_URL}/home-assistant?zone=DE",
+        status=200,
+        body=load_fixture("response.json"),
+    )
+    cache = electricitymaps_client.cache = ResponseCache()
+
+    first = await electricitymaps_client.zone_snapshot(
+        ZoneRequest("DE"),
+        home_assistant=True,
+    )
+    second = await electricitymaps_client.zone_snapshot(
+        ZoneRequest("DE"),
+        home_assistant=True,
+    )
+    without_home_assistant = await electricitymaps_client.zone_snapshot(
+        ZoneRequest("DE"),
+    )
+
+    assert first is second
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert first.home_assistant is not None
+    assert without_home_assistant.home_assistant is None
+    assert sum(len(calls) for calls in responses.requests.values()) == 3
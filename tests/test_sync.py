@@ -0,0 +1,124 @@
+"""Tests for the blocking client."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioelectricitymaps import (
+    ElectricityMaps,
+    ElectricityMapsConnectionTimeoutError,
+    ElectricityMapsInvalidTokenError,
+    ResponseCache,
+    SyncElectricityMaps,
+    ZoneRequest,
+)
+
+from . import load_fixture
+
+DE_URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+def test_threads_share_one_client(responses: aioresponses) -> None:
+    """Test concurrent calls from many threads share the session and cache."""
+    responses.get(
+        DE_URL,
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+        repeat=True,
+    )
+
+    with SyncElectricityMaps(
+        client=ElectricityMaps(token="abc123", cache=ResponseCache()),
+    ) as em:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: em.latest_carbon_intensity(ZoneRequest("DE")),
+                    range(16),
+                ),
+            )
+        session = em.client.session
+
+    assert {result.carbon_intensity for result in results} == {216}
+    assert len(responses.requests[("GET", URL(DE_URL))]) == 1
+    assert session is not None
+    assert session.closed
+
+
+def test_errors_are_raised(responses: aioresponses) -> None:
+    """Test errors of the async client are raised in the calling thread."""
+    responses.get(DE_URL, status=401)
+
+    with (
+        SyncElectricityMaps(client=ElectricityMaps(token="abc123")) as em,
+        pytest.raises(ElectricityMapsInvalidTokenError),
+    ):
+        em.latest_carbon_intensity(ZoneRequest("DE"))
+
+
+@pytest.mark.usefixtures("responses")
+def test_timeout() -> None:
+    """Test calls exceeding the timeout raise a timeout error."""
+
+    async def slow_zones(**_kwargs: Any) -> None:
+        await asyncio.sleep(1)
+
+    em = SyncElectricityMaps(client=ElectricityMaps(token="abc123"), timeout=0.05)
+    with (
+        patch.object(em.client, "zones", side_effect=slow_zones),
+        pytest.raises(ElectricityMapsConnectionTimeoutError),
+    ):
+        em.zones()
+
+    start = time.perf_counter()
+    em.close()
+    em.close()
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.usefixtures("responses")
+def test_per_call_timeout() -> None:
+    """Test the per-call timeout is passed to the async client."""
+
+    async def slow_send(**_kwargs: Any) -> None:
+        await asyncio.sleep(1)
+
+    client = ElectricityMaps(token="abc123")
+    with (
+        SyncElectricityMaps(client=client) as em,
+        patch.object(client, "_send", side_effect=slow_send),
+        pytest.raises(ElectricityMapsConnectionTimeoutError),
+    ):
+        em.latest_carbon_intensity(ZoneRequest("DE"), timeout=0.05)
+
+
+def test_history_and_snapshot(responses: aioresponses) -> None:
+    """Test history and zone snapshots with a per-call timeout."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/carbon-intensity/history?zone=DE",
+        status=200,
+        body=load_fixture("carbon_intensity_history.json"),
+    )
+    responses.get(
+        DE_URL,
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+    responses.get(
+        "https://api.electricitymaps.com/v3/power-breakdown/latest?zone=DE",
+        status=200,
+        body=load_fixture("latest_power_breakdown.json"),
+    )
+
+    with SyncElectricityMaps(client=ElectricityMaps(token="abc123")) as em:
+        history = em.carbon_intensity_history(ZoneRequest("DE"), timeout=5).history
+        snapshot = em.zone_snapshot(ZoneRequest("DE"), timeout=5)
+
+    assert len(history) == 24
+    assert snapshot.carbon_intensity.carbon_intensity == 216
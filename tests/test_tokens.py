@@ -0,0 +1,109 @@
+"""Tests for the token pool."""
+
+import asyncio
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioelectricitymaps import ElectricityMaps, TokenPool, ZoneRequest
+from aioelectricitymaps.exceptions import ElectricityMapsInvalidTokenError
+
+from . import load_fixture
+
+LATEST_URL = "https://api.electricitymaps.com/v3/carbon-intensity/latest?zone=DE"
+
+
+def _sent_tokens(responses: aioresponses) -> list[str]:
+    """Return the token of every request sent to LATEST_URL."""
+    return [
+        call.kwargs["headers"]["auth-token"]
+        for call in responses.requests[("GET", URL(LATEST_URL))]
+    ]
+
+
+async def test_invalid_token_is_benched(responses: aioresponses) -> None:
+    """Test a rejected token is benched and the request sent with another."""
+    pool = TokenPool(tokens=["bad", "good"], rate=10, burst=5)
+    responses.get(LATEST_URL, status=401)
+    responses.get(
+        LATEST_URL,
+        status=200,
+        body=load_fixture("latest_carbon_intensity.json"),
+    )
+
+    # Make sure the bad token is picked first.
+    pool._limiters["good"]._tokens = 0
+
+    async with ElectricityMaps(token_pool=pool) as em:
+        result = await em.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert result.zone == "US-CAR-DUK"
+    assert _sent_tokens(responses) == ["bad", "good"]
+    assert pool.available() == ["good"]
+
+
+async def test_invalid_last_token_fails_fast(responses: aioresponses) -> None:
+    """Test a rejected token isn't retried once it is benched."""
+    pool = TokenPool(tokens=["bad"], rate=10, burst=5, bench_duration=60)
+    responses.get(LATEST_URL, status=401, repeat=True)
+
+    async with ElectricityMaps(token_pool=pool) as em:
+        with pytest.raises(ElectricityMapsInvalidTokenError):
+            await asyncio.wait_for(em.latest_carbon_intensity(ZoneRequest("DE")), 1)
+
+    assert _sent_tokens(responses) == ["bad"]
+
+
+async def test_repeated_rate_limits_bench_token() -> None:
+    """Test a token is benched after repeated 429 responses."""
+    pool = TokenPool(tokens=["a", "b"], rate=10, rate_limit_threshold=2)
+
+    pool.report_rate_limited("a", None)
+    assert pool.available() == ["a", "b"]
+    pool.report_rate_limited("a", None)
+    assert pool.available() == ["b"]
+
+    pool.report_rate_limited("b", retry_after=30)
+    assert pool.available() == []
+
+
+async def test_success_resets_rate_limit_count() -> None:
+    """Test a successful request resets the consecutive 429 count."""
+    pool = TokenPool(tokens=["a"], rate=10, rate_limit_threshold=2)
+
+    pool.report_rate_limited("a", None)
+    pool.report_success("a")
+    pool.report_rate_limited("a", None)
+
+    assert pool.available() == ["a"]
+
+
+async def test_acquire_prefers_headroom() -> None:
+    """Test the token with the most headroom is used."""
+    pool = TokenPool(tokens=["a", "b"], rate=1, burst=3)
+
+    assert [await pool.acquire() for _ in range(4)] == ["a", "b", "a", "b"]
+
+
+async def test_acquire_waits_for_benched_token() -> None:
+    """Test acquire waits for a benched token instead of failing."""
+    pool = TokenPool(tokens=["a"], rate=10, bench_duration=0.01)
+    pool.report_invalid("a")
+
+    assert await pool.acquire() == "a"
+
+
+def test_empty_pool() -> None:
+    """Test a pool needs at least one token."""
+    with pytest.raises(ValueError, match="at least one token"):
+        TokenPool(tokens=[], rate=1)
+
+
+async def test_no_token(responses: aioresponses) -> None:
+    """Test a client without token or pool raises."""
+    async with ElectricityMaps() as em:
+        with pytest.raises(ElectricityMapsInvalidTokenError):
+            await em.latest_carbon_intensity(ZoneRequest("DE"))
+
+    assert not responses.requests
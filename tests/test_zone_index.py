@@ -0,0 +1,69 @@
+"""Tests for the zone index."""
+
+from aioresponses import aioresponses
+
+from aioelectricitymaps import ElectricityMaps, ZoneIndex
+from aioelectricitymaps.models import Zone, ZonesResponse
+
+from . import load_fixture
+
+
+def _index() -> ZoneIndex:
+    """Build an index from the zones fixture."""
+    return ZoneIndex.from_response(ZonesResponse.from_json(load_fixture("zones.json")))
+
+
+def test_lookup() -> None:
+    """Test looking up zones by key."""
+    index = _index()
+
+    assert len(index) == 400
+    assert "DE" in index
+    assert index["DE"] == Zone(zone_name="Germany")
+    assert index.get("ZZ") is None
+    assert list(index)[:2] == ["AD", "AE"]
+
+
+def test_prefix_queries() -> None:
+    """Test enumerating sub-zones."""
+    index = _index()
+
+    assert index.sub_zones("AU-TAS") == ("AU-TAS-CBI", "AU-TAS-FI", "AU-TAS-KI")
+    assert len(index.sub_zones("US")) == 68
+    assert index.with_prefix("DE") == ("DE",)
+    assert index.sub_zones("DE") == ()
+
+
+def test_country_lookup() -> None:
+    """Test mapping a country name to its zones."""
+    index = _index()
+
+    assert index.by_country("Australia")[:3] == ("AU", "AU-LH", "AU-NSW")
+    assert index.by_country("Germany") == ("DE",)
+    assert index.by_country("Atlantis") == ()
+    assert "Canada" in index.countries
+
+
+def test_strings_are_interned() -> None:
+    """Test country names are shared between zones."""
+    index = _index()
+
+    assert index["AU-NSW"].country_name is index["AU-VIC"].country_name
+
+
+async def test_load_zone_index(
+    electricitymaps_client: ElectricityMaps,
+    responses: aioresponses,
+) -> None:
+    """Test the index is built once and can be shared."""
+    responses.get(
+        "https://api.electricitymaps.com/v3/zones",
+        status=200,
+        body=load_fixture("zones.json"),
+    )
+
+    index = await electricitymaps_client.load_zone_index()
+    assert await electricitymaps_client.load_zone_index() is index
+
+    other = ElectricityMaps(token="abc123", zone_index=index)
+    assert await other.load_zone_index() is index